@@ -0,0 +1,27 @@
+"""Shared pytest fixtures for the root-level test scripts.
+
+Session-scoped so NVML, the CUDA context and the speedtest.net configuration
+are set up once per pytest run instead of once per test module.
+"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def gpu_benchmark():
+    """GPUBenchmark shared by every test in the session."""
+    from src.monitors.gpu_benchmark import GPUBenchmark
+    return GPUBenchmark()
+
+
+@pytest.fixture(scope="session")
+def speedtest_monitor():
+    """SpeedTestMonitor shared by every test in the session."""
+    from src.monitors.speedtest import SpeedTestMonitor
+    return SpeedTestMonitor()
+
+
+@pytest.fixture(scope="session")
+def speedtest_client():
+    """speedtest-cli client, configured once per session."""
+    speedtest = pytest.importorskip("speedtest")
+    return speedtest.Speedtest()
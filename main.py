@@ -5,15 +5,14 @@ System Monitor - Hardware monitoring tool for CPU, Memory, Disk, Network, and GP
 This tool provides both CLI and REST API interfaces for monitoring system hardware.
 """
 import click
-import json
 from pathlib import Path
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from src.cli.dashboard import Dashboard
 from src.api.server import MonitoringAPI
 from src.config import Config
-from src.storage.database import HistoricalDatabase
-from src.storage.exporter import DataExporter
+from src.storage.database import HistoricalDatabase, to_dicts
+from src.storage.exporter import DataExporter, to_json
 from src.alerts.alert_manager import AlertManager
 from src.monitors.cpu import CPUMonitor
 from src.monitors.memory import MemoryMonitor
@@ -64,10 +63,10 @@ def snapshot(format, output, config):
             snapshot_data = dash.get_snapshot()
             if output:
                 with open(output, 'w') as f:
-                    json.dump(snapshot_data, f, indent=2, default=str)
+                    f.write(to_json(snapshot_data))
                 click.echo(f"Snapshot saved to {output}")
             else:
-                click.echo(json.dumps(snapshot_data, indent=2, default=str))
+                click.echo(to_json(snapshot_data))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -97,11 +96,13 @@ def api(host, port, config, enable_history):
             def collect_data():
                 """Background task to collect and store monitoring data."""
                 try:
-                    db.store_cpu_data(cpu_monitor.get_usage(interval=0.1))
-                    db.store_memory_data(memory_monitor.get_memory())
-                    db.store_disk_data(disk_monitor.get_complete_stats())
-                    db.store_network_data(network_monitor.get_io_counters(per_nic=True))
-                    db.store_gpu_data(gpu_monitor.get_all_gpus())
+                    db.store_snapshot({
+                        "cpu": cpu_monitor.get_usage(interval=0.1),
+                        "memory": memory_monitor.get_memory(),
+                        "disk": disk_monitor.get_complete_stats(),
+                        "network": network_monitor.get_io_counters(per_nic=True),
+                        "gpu": gpu_monitor.get_all_gpus()
+                    })
                 except Exception as e:
                     click.echo(f"Error collecting data: {e}", err=True)
 
@@ -186,14 +187,14 @@ def history(metric, hours, limit, format, output):
         db = HistoricalDatabase()
         table_name = f"{metric}_history"
 
-        history_data = db.get_history(table_name, hours=hours, limit=limit)
+        history_data = db.get_history_columnar(table_name, hours=hours, limit=limit)
 
-        if not history_data:
+        if not history_data["rows"]:
             click.echo(f"No historical data found for {metric}")
             return
 
         if format == 'json':
-            output_data = json.dumps(history_data, indent=2, default=str)
+            output_data = to_json(to_dicts(history_data))
             if output:
                 with open(output, 'w') as f:
                     f.write(output_data)
@@ -202,7 +203,7 @@ def history(metric, hours, limit, format, output):
                 click.echo(output_data)
         else:  # csv
             exporter = DataExporter()
-            filepath = exporter.export_to_csv(history_data, filename=output)
+            filepath = exporter.export_columnar_to_csv(history_data, filename=output)
             click.echo(f"History exported to: {filepath}")
 
     except Exception as e:
@@ -267,7 +268,7 @@ def speedtest(format, server_id):
             return
 
         if format == 'json':
-            click.echo(json.dumps(result, indent=2, default=str))
+            click.echo(to_json(result))
         else:
             click.echo("\n" + "=" * 60)
             click.echo("Internet Speed Test Results")
@@ -294,13 +295,18 @@ def speedtest(format, server_id):
 
 @cli.command()
 @click.option('--device-id', '-d', default=0, type=int, help='GPU device ID')
-@click.option('--test', '-t', type=click.Choice(['info', 'memory', 'compute', 'stress', 'mlperf', 'resnet', 'bert', 'full']),
+@click.option('--test', '-t', type=click.Choice(['info', 'memory', 'compute', 'gemm', 'stress', 'mlperf', 'resnet', 'bert', 'full']),
               default='full', help='Type of benchmark to run')
 @click.option('--format', '-f', type=click.Choice(['json', 'table']), default='table',
               help='Output format')
 @click.option('--duration', default=10, type=int, help='Stress test duration in seconds')
 @click.option('--include-mlperf', is_flag=True, help='Include MLPerf benchmarks in full test')
-def gpu_benchmark(device_id, test, format, duration, include_mlperf):
+@click.option('--stabilize-clocks', is_flag=True, help='Lock GPU clocks during the full test (requires root)')
+@click.option('--all-gpus', is_flag=True, help='Run the info or full test on every GPU in parallel')
+@click.option('--dtype', type=click.Choice(['fp16', 'bf16', 'tf32', 'fp32']), default='fp16',
+              help='Headline matmul precision for the compute test; fp32 also disables TF32 for resnet/bert')
+@click.option('--isolate', is_flag=True, help='Run each phase of the full test in its own process')
+def gpu_benchmark(device_id, test, format, duration, include_mlperf, stabilize_clocks, all_gpus, dtype, isolate):
     """Run GPU benchmark tests."""
     try:
         benchmark = GPUBenchmark()
@@ -319,37 +325,53 @@ def gpu_benchmark(device_id, test, format, duration, include_mlperf):
 
         # Run selected benchmark
         if test == 'info':
-            result = benchmark.get_gpu_info(device_id)
+            result = benchmark.get_all_gpu_info() if all_gpus else benchmark.get_gpu_info(device_id)
         elif test == 'memory':
             click.echo(f"Running memory bandwidth benchmark on GPU {device_id}...")
             result = benchmark.benchmark_memory_bandwidth(device_id)
         elif test == 'compute':
             click.echo(f"Running compute performance benchmark on GPU {device_id}...")
-            result = benchmark.benchmark_compute_performance(device_id)
+            result = benchmark.benchmark_compute_performance(device_id, dtype=dtype)
+        elif test == 'gemm':
+            click.echo(f"Running peak GEMM benchmark on GPU {device_id}...")
+            result = benchmark.benchmark_gemm_peak(device_id)
         elif test == 'stress':
             click.echo(f"Running stress test on GPU {device_id} for {duration} seconds...")
             result = benchmark.stress_test(device_id, duration_seconds=duration)
         elif test == 'resnet':
             click.echo(f"Running ResNet-50 inference benchmark on GPU {device_id}...")
-            result = benchmark.benchmark_resnet_inference(device_id)
+            result = benchmark.benchmark_resnet_inference(device_id, tf32=dtype != 'fp32')
         elif test == 'bert':
             click.echo(f"Running BERT inference benchmark on GPU {device_id}...")
-            result = benchmark.benchmark_bert_inference(device_id)
+            result = benchmark.benchmark_bert_inference(device_id, tf32=dtype != 'fp32')
         elif test == 'mlperf':
             click.echo(f"Running MLPerf benchmark suite on GPU {device_id}...")
             click.echo("This may take several minutes...\n")
             result = benchmark.benchmark_mlperf_suite(device_id)
         else:  # full
-            click.echo(f"Running full benchmark suite on GPU {device_id}...")
+            if all_gpus:
+                click.echo(f"Running full benchmark suite on all {benchmark.gpu_count} GPUs...")
+            else:
+                click.echo(f"Running full benchmark suite on GPU {device_id}...")
             if include_mlperf:
                 click.echo("Including MLPerf benchmarks - this may take several minutes...\n")
             else:
                 click.echo("This may take 30-60 seconds...\n")
-            result = benchmark.run_full_benchmark(device_id, include_mlperf=include_mlperf)
+            if all_gpus:
+                result = benchmark.run_full_benchmark_all(include_mlperf=include_mlperf,
+                                                          stabilize_clocks=stabilize_clocks,
+                                                          isolate=isolate)
+            else:
+                result = benchmark.run_full_benchmark(device_id, include_mlperf=include_mlperf,
+                                                      stabilize_clocks=stabilize_clocks,
+                                                      isolate=isolate)
 
         # Output results
         if format == 'json':
-            click.echo(json.dumps(result, indent=2, default=str))
+            click.echo(to_json(result))
+        elif isinstance(result, list):
+            for device_result in result:
+                _print_benchmark_results(device_result, test)
         else:
             _print_benchmark_results(result, test)
 
@@ -401,6 +423,12 @@ def _print_benchmark_results(result: dict, test_type: str):
             if 'host_to_device' in mem['tests']:
                 h2d = mem['tests']['host_to_device']
                 click.echo(f"  Host -> Device: {h2d['bandwidth_gb_per_sec']:.2f} GB/s")
+            if 'host_to_device_multistream' in mem['tests']:
+                multi = mem['tests']['host_to_device_multistream']
+                click.echo(f"  Host -> Device ({multi['streams']} streams): {multi['bandwidth_gb_per_sec']:.2f} GB/s")
+            if 'host_to_device_pageable' in mem['tests']:
+                pageable = mem['tests']['host_to_device_pageable']
+                click.echo(f"  Host -> Device (pageable): {pageable['bandwidth_gb_per_sec']:.2f} GB/s")
             if 'device_to_host' in mem['tests']:
                 d2h = mem['tests']['device_to_host']
                 click.echo(f"  Device -> Host: {d2h['bandwidth_gb_per_sec']:.2f} GB/s")
@@ -409,15 +437,26 @@ def _print_benchmark_results(result: dict, test_type: str):
                 click.echo(f"  Device -> Device: {d2d['bandwidth_gb_per_sec']:.2f} GB/s")
     elif test_type == 'memory' and 'tests' in result:
         click.echo("\nMemory Bandwidth:")
+        pcie = result.get('pcie')
+        if pcie and pcie.get('peak_gb_per_sec'):
+            click.echo(f"  PCIe Link: Gen{pcie['generation']} x{pcie['width']} ({pcie['peak_gb_per_sec']:.1f} GB/s peak)")
         if 'host_to_device' in result['tests']:
             h2d = result['tests']['host_to_device']
             click.echo(f"  Host -> Device: {h2d['bandwidth_gb_per_sec']:.2f} GB/s")
+        if 'host_to_device_multistream' in result['tests']:
+            multi = result['tests']['host_to_device_multistream']
+            click.echo(f"  Host -> Device ({multi['streams']} streams): {multi['bandwidth_gb_per_sec']:.2f} GB/s")
+        if 'host_to_device_pageable' in result['tests']:
+            pageable = result['tests']['host_to_device_pageable']
+            click.echo(f"  Host -> Device (pageable): {pageable['bandwidth_gb_per_sec']:.2f} GB/s")
         if 'device_to_host' in result['tests']:
             d2h = result['tests']['device_to_host']
             click.echo(f"  Device -> Host: {d2h['bandwidth_gb_per_sec']:.2f} GB/s")
         if 'device_to_device' in result['tests']:
             d2d = result['tests']['device_to_device']
             click.echo(f"  Device -> Device: {d2d['bandwidth_gb_per_sec']:.2f} GB/s")
+            if d2d.get('pct_of_peak') is not None:
+                click.echo(f"  DRAM Traffic: {d2d['dram_gb_per_sec']:.2f} GB/s ({d2d['pct_of_peak']:.1f}% of peak)")
 
     # Compute Performance
     if 'benchmarks' in result and 'compute_performance' in result['benchmarks']:
@@ -427,13 +466,35 @@ def _print_benchmark_results(result: dict, test_type: str):
             if 'matmul_fp32' in compute['operations']:
                 matmul = compute['operations']['matmul_fp32']
                 click.echo(f"  Matrix Multiply (FP32): {matmul['tflops']:.2f} TFLOPS")
-                click.echo(f"  Average Time: {matmul['avg_time_seconds']*1000:.2f} ms")
+                click.echo(f"  Median Time: {matmul['median_time_seconds']*1000:.2f} ms")
+                if 'launch_overhead_seconds' in matmul:
+                    click.echo(f"  Launch Overhead: {matmul['launch_overhead_seconds']*1e6:.1f} us/matmul")
+            for key, label in (('matmul_fp32_ieee', 'FP32 IEEE'), ('matmul_fp32_tf32', 'TF32'), ('matmul_fp16', 'FP16'), ('matmul_bf16', 'BF16'), ('matmul_fp8', 'FP8')):
+                if key in compute['operations']:
+                    click.echo(f"  Matrix Multiply ({label}): {compute['operations'][key]['tflops']:.2f} TFLOPS")
     elif test_type == 'compute' and 'operations' in result:
         click.echo("\nCompute Performance:")
+        if 'matmul' in result['operations']:
+            click.echo(f"  Headline ({result['dtype'].upper()}): {result['operations']['matmul']['tflops']:.2f} TFLOPS")
         if 'matmul_fp32' in result['operations']:
             matmul = result['operations']['matmul_fp32']
             click.echo(f"  Matrix Multiply (FP32): {matmul['tflops']:.2f} TFLOPS")
-            click.echo(f"  Average Time: {matmul['avg_time_seconds']*1000:.2f} ms")
+            click.echo(f"  Median Time: {matmul['median_time_seconds']*1000:.2f} ms")
+            if 'launch_overhead_seconds' in matmul:
+                click.echo(f"  Launch Overhead: {matmul['launch_overhead_seconds']*1e6:.1f} us/matmul")
+        for key, label in (('matmul_fp32_ieee', 'FP32 IEEE'), ('matmul_fp32_tf32', 'TF32'), ('matmul_fp16', 'FP16'), ('matmul_bf16', 'BF16'), ('matmul_fp8', 'FP8')):
+            if key in result['operations']:
+                click.echo(f"  Matrix Multiply ({label}): {result['operations'][key]['tflops']:.2f} TFLOPS")
+
+    # Peak GEMM
+    if test_type == 'gemm' and 'shapes' in result:
+        click.echo("\nPeak GEMM Throughput:")
+        for shape, variants in result['shapes'].items():
+            for dtype, gemm in variants.items():
+                click.echo(f"  {shape} ({dtype.upper()}): {gemm['tflops']:.2f} TFLOPS")
+        if 'peak_fp32_tc' in result:
+            peak = result['peak_fp32_tc']
+            click.echo(f"  Peak FP32 (TF32 Tensor Cores): {peak['tflops']:.2f} TFLOPS at {peak['shape']}")
 
     # Stress Test
     if 'benchmarks' in result and 'stress_test' in result['benchmarks']:
@@ -451,6 +512,11 @@ def _print_benchmark_results(result: dict, test_type: str):
             if stats.get('utilization'):
                 util = stats['utilization']
                 click.echo(f"  Utilization: Min={util['min']}%, Max={util['max']}%, Avg={util['avg']:.1f}%")
+            if 'throttle_percent' in stats:
+                clock = stats['sm_clock_mhz']
+                click.echo(f"  SM Clock: Min={clock['min']:.0f} MHz, Max={clock['max']:.0f} MHz, Avg={clock['avg']:.0f} MHz")
+                active = [name for name, pct in stats['throttle_reasons_percent'].items() if pct > 0]
+                click.echo(f"  Throttled: {stats['throttle_percent']:.1f}% of samples" + (f" ({', '.join(active)})" if active else ""))
     elif test_type == 'stress' and 'statistics' in result:
         click.echo("\nStress Test Results:")
         stats = result['statistics']
@@ -464,6 +530,11 @@ def _print_benchmark_results(result: dict, test_type: str):
         if stats.get('utilization'):
             util = stats['utilization']
             click.echo(f"  Utilization: Min={util['min']}%, Max={util['max']}%, Avg={util['avg']:.1f}%")
+        if 'throttle_percent' in stats:
+            clock = stats['sm_clock_mhz']
+            click.echo(f"  SM Clock: Min={clock['min']:.0f} MHz, Max={clock['max']:.0f} MHz, Avg={clock['avg']:.0f} MHz")
+            active = [name for name, pct in stats['throttle_reasons_percent'].items() if pct > 0]
+            click.echo(f"  Throttled: {stats['throttle_percent']:.1f}% of samples" + (f" ({', '.join(active)})" if active else ""))
 
     # MLPerf Benchmarks
     if 'benchmarks' in result and 'mlperf' in result['benchmarks']:
@@ -480,6 +551,9 @@ def _print_benchmark_results(result: dict, test_type: str):
                 click.echo(f"    Latency (avg): {m['avg_latency_ms']:.2f} ms")
                 click.echo(f"    Latency (p95): {m['p95_latency_ms']:.2f} ms")
                 click.echo(f"    Latency (p99): {m['p99_latency_ms']:.2f} ms")
+                if 'metrics_fp16_nhwc' in resnet:
+                    m16 = resnet['metrics_fp16_nhwc']
+                    click.echo(f"    Throughput (FP16 NHWC): {m16['throughput_images_per_sec']:.2f} images/sec")
 
             # BERT
             if 'bert' in mlperf['benchmarks'] and 'metrics' in mlperf['benchmarks']['bert']:
@@ -491,6 +565,9 @@ def _print_benchmark_results(result: dict, test_type: str):
                 click.echo(f"    Latency (p95): {m['p95_latency_ms']:.2f} ms")
                 click.echo(f"    Latency (p99): {m['p99_latency_ms']:.2f} ms")
 
+            if 'score_geomean' in mlperf:
+                click.echo(f"\n  Score (geomean): {mlperf['score_geomean']:.2f}")
+
     # Individual MLPerf tests (resnet/bert)
     if test_type == 'resnet' and 'metrics' in result:
         click.echo("\nResNet-50 Inference Benchmark:")
@@ -503,6 +580,10 @@ def _print_benchmark_results(result: dict, test_type: str):
         click.echo(f"  P95 Latency: {m['p95_latency_ms']:.2f} ms")
         click.echo(f"  P99 Latency: {m['p99_latency_ms']:.2f} ms")
         click.echo(f"  Total Images: {m['total_images']}")
+        if 'metrics_fp16_nhwc' in result:
+            m16 = result['metrics_fp16_nhwc']
+            click.echo(f"  FP16 NHWC Throughput: {m16['throughput_images_per_sec']:.2f} images/sec")
+            click.echo(f"  FP16 NHWC P50 Latency: {m16['p50_latency_ms']:.2f} ms")
 
     if test_type == 'bert' and 'metrics' in result:
         click.echo("\nBERT Inference Benchmark:")
@@ -532,7 +613,8 @@ def _print_benchmark_results(result: dict, test_type: str):
               default='high', help='Workload intensity')
 @click.option('--output-dir', '-o', default='./benchmark_results', help='Output directory for results')
 @click.option('--export', is_flag=True, help='Export results to JSON/CSV')
-def gpu_stress(device_id, test, suite_type, duration, intensity, output_dir, export):
+@click.option('--metrics-csv', type=click.Path(), help='Stream GPU metrics to this CSV file while the test runs')
+def gpu_stress(device_id, test, suite_type, duration, intensity, output_dir, export, metrics_csv):
     """Run intensive GPU stress tests and benchmarks."""
     try:
         benchmark = GPUStressBenchmark()
@@ -552,7 +634,8 @@ def gpu_stress(device_id, test, suite_type, duration, intensity, output_dir, exp
         elif test == 'memory-stress':
             click.echo(f"Running memory stress test on GPU {device_id}...")
             click.echo("This will fill GPU memory and stress memory bandwidth...")
-            result = benchmark.benchmark_memory_stress(device_id, duration_seconds=duration*60)
+            result = benchmark.benchmark_memory_stress(device_id, duration_seconds=duration*60,
+                                                       metrics_csv=metrics_csv)
 
         elif test == 'sustained-load':
             click.echo(f"Running {duration} minute sustained load test ({intensity} intensity)...")
@@ -560,7 +643,8 @@ def gpu_stress(device_id, test, suite_type, duration, intensity, output_dir, exp
             result = benchmark.benchmark_sustained_load(
                 device_id,
                 duration_minutes=duration,
-                workload_intensity=intensity
+                workload_intensity=intensity,
+                metrics_csv=metrics_csv
             )
 
         elif test == 'multi-gpu':
@@ -574,7 +658,7 @@ def gpu_stress(device_id, test, suite_type, duration, intensity, output_dir, exp
             result = benchmark.run_benchmark_suite(device_id, suite_type=suite_type)
 
         # Display results
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(to_json(result))
 
         # Export if requested
         if export and result:
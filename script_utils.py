@@ -0,0 +1,32 @@
+"""Helpers shared by the root-level test scripts when run standalone."""
+
+import io
+import sys
+import traceback
+from contextlib import redirect_stdout
+
+
+def run_buffered(fn, *args, error_prefix: str = "Error"):
+    """
+    Run a test function and write its whole report with a single call.
+
+    Output is collected in memory instead of being flushed line by line.
+    On failure the error message ends the report and the traceback goes
+    to stderr.
+
+    Args:
+        fn: Test function to run
+        *args: Arguments passed to fn
+        error_prefix: Label printed before the error message
+    """
+    buffer = io.StringIO()
+    error = None
+    try:
+        with redirect_stdout(buffer):
+            fn(*args)
+    except Exception as e:
+        buffer.write(f"\n{error_prefix}: {e}\n")
+        error = traceback.format_exc()
+    sys.stdout.write(buffer.getvalue())
+    if error:
+        sys.stderr.write(error)
@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse, Response
 from typing import Optional, Dict, List
 from datetime import datetime
+import asyncio
 import uvicorn
 from pathlib import Path
 
@@ -55,7 +56,9 @@ class MonitoringAPI:
         self.alert_manager = AlertManager(self.config.get_thresholds())
 
         # Initialize Prometheus exporter
-        self.prometheus_exporter = PrometheusExporter()
+        self.prometheus_exporter = PrometheusExporter(
+            update_intervals=self.config.get("metrics.update_intervals")
+        )
 
         # Configure CORS
         if self.config.get("api.enable_cors", True):
@@ -208,7 +211,9 @@ class MonitoringAPI:
         async def run_speedtest(server_id: Optional[int] = Query(None, description="Specific server ID to test")):
             """Run an internet speed test (may take 30-60 seconds)."""
             try:
-                result = self.speedtest_monitor.run_speedtest(server_id=server_id)
+                result = await asyncio.wrap_future(
+                    self.speedtest_monitor.start_speedtest(server_id=server_id)
+                )
                 if 'error' in result:
                     raise HTTPException(status_code=500, detail=result.get('error'))
                 return result
@@ -505,7 +510,7 @@ class MonitoringAPI:
                         detail="GPU stress testing not available. Requires PyTorch with CUDA."
                     )
 
-                result = self.gpu_stress_benchmark.benchmark_multi_gpu(
+                result = await self.gpu_stress_benchmark.benchmark_multi_gpu_async(
                     duration_seconds=duration_seconds
                 )
 
@@ -718,7 +723,7 @@ class MonitoringAPI:
             Returns system metrics in Prometheus text format for scraping.
             """
             try:
-                metrics = self.prometheus_exporter.generate_metrics()
+                metrics = await self.prometheus_exporter.generate_metrics_async()
                 return Response(
                     content=metrics,
                     media_type=self.prometheus_exporter.get_content_type()
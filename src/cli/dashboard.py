@@ -209,7 +209,7 @@ class Dashboard:
             "memory": self.memory_monitor.get_memory(),
             "disk": self.disk_monitor.get_complete_stats(),
             "network": self.network_monitor.get_io_counters(per_nic=True),
-            "gpu": self.gpu_monitor.get_all_gpus()
+            "gpu": self.gpu_monitor.poll_all_gpus()
         }
 
     def display_snapshot(self):
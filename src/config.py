@@ -51,6 +51,15 @@ class Config:
                 "port": 8000,
                 "enable_cors": True
             },
+            "metrics": {
+                "update_intervals": {
+                    "cpu": 0,
+                    "memory": 0,
+                    "disk": 0,
+                    "network": 0,
+                    "gpu": 5
+                }
+            },
             "cli": {
                 "refresh_rate": 1,
                 "show_graphs": True
@@ -1,20 +1,75 @@
 """Prometheus metrics exporter for system monitoring."""
-from prometheus_client import Counter, Gauge, Histogram, Info, generate_latest, CONTENT_TYPE_LATEST
-from typing import Dict, Optional
+from prometheus_client import (
+    Counter, Gauge, Histogram, Info, generate_latest, disable_created_metrics, CONTENT_TYPE_LATEST
+)
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
 import time
 
 from ..monitors.cpu import CPUMonitor
 from ..monitors.memory import MemoryMonitor
 from ..monitors.disk import DiskMonitor
 from ..monitors.network import NetworkMonitor
-from ..monitors.gpu import GPUMonitor
+from ..monitors.gpu import GPUMonitor, gpu_poll_interval
+
+# Counters mirror psutil totals that start at boot, not at exporter start, so
+# the *_created series would be misleading and only doubles the payload
+disable_created_metrics()
+
+# Minimum seconds between logged tracebacks for the same subsystem
+ERROR_LOG_INTERVAL = 60.0
+
+# Minimum seconds between refreshes of each subsystem. CPU and memory change
+# quickly and are cheap; NVML queries are the most expensive part of a scrape
+# while GPU readings move on human timescales. Between refreshes the gauges
+# keep their last value.
+DEFAULT_UPDATE_INTERVALS = {
+    'cpu': 0.0,
+    'memory': 0.0,
+    'disk': 0.0,
+    'network': 0.0,
+    'gpu': 5.0
+}
+
+# Field order matches the children tuples built by _bind_partition_children
+_PARTITION_FIELDS = ('total', 'used', 'free', 'percent')
+
+
+def _set_counter(counter, value):
+    """
+    Set a counter child to an absolute value.
+
+    psutil disk/network counters are already monotonic totals, so they are
+    exported as-is and Prometheus computes rates server-side instead of us
+    tracking deltas between scrapes. The value is stored as the integer psutil
+    returned; conversion to float only happens when the text format is
+    rendered.
+
+    Args:
+        counter: Labelled Counter child
+        value: Absolute counter value
+    """
+    counter._value.set(value)
 
 
 class PrometheusExporter:
     """Export system metrics in Prometheus format."""
 
-    def __init__(self):
-        """Initialize Prometheus metrics."""
+    def __init__(self, update_intervals: Optional[Dict[str, float]] = None):
+        """
+        Initialize Prometheus metrics.
+
+        Args:
+            update_intervals: Minimum seconds between refreshes per subsystem
+                (cpu, memory, disk, network, gpu); merged over
+                DEFAULT_UPDATE_INTERVALS. GPU_POLL_INTERVAL_SECONDS in the
+                environment takes precedence for gpu.
+        """
+        self.update_intervals = {**DEFAULT_UPDATE_INTERVALS, **(update_intervals or {})}
+        self.update_intervals['gpu'] = gpu_poll_interval(self.update_intervals['gpu'])
+        self._next_update = dict.fromkeys(self.update_intervals, 0.0)
+
         # CPU Metrics
         self.cpu_percent = Gauge('system_cpu_percent', 'CPU usage percentage', ['cpu'])
         self.cpu_frequency = Gauge('system_cpu_frequency_mhz', 'CPU frequency in MHz', ['cpu', 'type'])
@@ -65,6 +120,12 @@ class PrometheusExporter:
 
         # System Info
         self.system_info = Info('system_monitor', 'System monitor information')
+        self.collect_errors = Counter(
+            'system_monitor_collect_errors_total', 'Metric collection errors', ['subsystem']
+        )
+
+        self.logger = logging.getLogger(__name__)
+        self._last_error_log = {}
 
         # Initialize monitors
         self.cpu_monitor = CPUMonitor()
@@ -73,17 +134,89 @@ class PrometheusExporter:
         self.network_monitor = NetworkMonitor()
         self.gpu_monitor = GPUMonitor()
 
-        # Store last network/disk values for counter updates
-        self.last_network_counters = {}
-        self.last_disk_counters = {}
+        # Labelled children bound to the discovered device topology. Disks and
+        # NICs rarely change, so children are resolved once and only rebound
+        # when the device set differs from the previous scrape.
+        self._partition_keys = []
+        self._partition_children = []
+        self._disk_io_children = {}
+        self._network_children = {}
+
+        # Scrape currently being generated for async callers
+        self._inflight = None
+
+    def _bind_partition_children(self, keys: List[Tuple[str, str]]):
+        """Resolve partition usage gauge children for the current mounts."""
+        metrics = (self.disk_total, self.disk_used, self.disk_free, self.disk_percent)
+        self._partition_keys = keys
+        self._partition_children = [
+            tuple(metric.labels(device=device, mountpoint=mountpoint) for metric in metrics)
+            for device, mountpoint in keys
+        ]
+
+    def _bind_disk_io_children(self, devices):
+        """
+        Resolve disk I/O counter children for the current disks.
+
+        Children are ordered like psutil's sdiskio fields so raw counter
+        tuples can be zipped against them positionally.
+        """
+        metrics = (self.disk_read_count, self.disk_write_count, self.disk_read_bytes, self.disk_write_bytes)
+        self._disk_io_children = {
+            device: tuple(metric.labels(device=device) for metric in metrics)
+            for device in devices
+        }
+
+    def _bind_network_children(self, interfaces):
+        """
+        Resolve network counter children for the current interfaces.
+
+        Children are ordered like psutil's snetio fields so raw counter
+        tuples can be zipped against them positionally.
+        """
+        metrics = (
+            self.network_bytes_sent, self.network_bytes_recv,
+            self.network_packets_sent, self.network_packets_recv,
+            self.network_errors_in, self.network_errors_out,
+            self.network_drops_in, self.network_drops_out
+        )
+        self._network_children = {
+            interface: tuple(metric.labels(interface=interface) for metric in metrics)
+            for interface in interfaces
+        }
+
+    def _record_error(self, subsystem: str):
+        """
+        Count a collection failure and log it at a bounded rate.
+
+        A failing driver (e.g. NVML flapping) would otherwise emit a traceback
+        on every scrape; the counter still records every occurrence.
+
+        Args:
+            subsystem: Name of the subsystem that failed
+        """
+        self.collect_errors.labels(subsystem=subsystem).inc()
+
+        now = time.monotonic()
+        if now - self._last_error_log.get(subsystem, float('-inf')) >= ERROR_LOG_INTERVAL:
+            self._last_error_log[subsystem] = now
+            self.logger.exception(f"Error updating {subsystem} metrics")
 
     def update_metrics(self):
-        """Update all Prometheus metrics with current system values."""
-        self._update_cpu_metrics()
-        self._update_memory_metrics()
-        self._update_disk_metrics()
-        self._update_network_metrics()
-        self._update_gpu_metrics()
+        """Update Prometheus metrics for every subsystem whose interval has elapsed."""
+        updaters = (
+            ('cpu', self._update_cpu_metrics),
+            ('memory', self._update_memory_metrics),
+            ('disk', self._update_disk_metrics),
+            ('network', self._update_network_metrics),
+            ('gpu', self._update_gpu_metrics)
+        )
+
+        for subsystem, update in updaters:
+            now = time.monotonic()
+            if now >= self._next_update[subsystem]:
+                update()
+                self._next_update[subsystem] = now + self.update_intervals[subsystem]
 
     def _update_cpu_metrics(self):
         """Update CPU metrics."""
@@ -129,8 +262,8 @@ class PrometheusExporter:
                 self.cpu_load_avg.labels(interval='5min').set(load.get('5min', 0))
                 self.cpu_load_avg.labels(interval='15min').set(load.get('15min', 0))
 
-        except Exception as e:
-            print(f"Error updating CPU metrics: {e}")
+        except Exception:
+            self._record_error('cpu')
 
     def _update_memory_metrics(self):
         """Update memory metrics."""
@@ -152,112 +285,48 @@ class PrometheusExporter:
                 self.swap_used.set(swap.get('used', 0))
                 self.swap_percent.set(swap.get('percent', 0))
 
-        except Exception as e:
-            print(f"Error updating memory metrics: {e}")
+        except Exception:
+            self._record_error('memory')
 
     def _update_disk_metrics(self):
         """Update disk metrics."""
         try:
-            disk_data = self.disk_monitor.get_complete_stats()
-
             # Disk usage by partition
-            if 'partitions' in disk_data:
-                for partition in disk_data['partitions']:
-                    device = partition.get('device', 'unknown')
-                    mountpoint = partition.get('mountpoint', 'unknown')
-                    usage = partition.get('usage', {})
-
-                    self.disk_total.labels(device=device, mountpoint=mountpoint).set(usage.get('total', 0))
-                    self.disk_used.labels(device=device, mountpoint=mountpoint).set(usage.get('used', 0))
-                    self.disk_free.labels(device=device, mountpoint=mountpoint).set(usage.get('free', 0))
-                    self.disk_percent.labels(device=device, mountpoint=mountpoint).set(usage.get('percent', 0))
-
-            # Disk I/O counters
-            if 'io_counters' in disk_data:
-                for device, counters in disk_data['io_counters'].items():
-                    # Use counter's _value attribute or set directly
-                    read_bytes = counters.get('read_bytes', 0)
-                    write_bytes = counters.get('write_bytes', 0)
-                    read_count = counters.get('read_count', 0)
-                    write_count = counters.get('write_count', 0)
-
-                    # Store current values and calculate delta
-                    if device in self.last_disk_counters:
-                        last = self.last_disk_counters[device]
-                        if read_bytes >= last['read_bytes']:
-                            self.disk_read_bytes.labels(device=device).inc(read_bytes - last['read_bytes'])
-                        if write_bytes >= last['write_bytes']:
-                            self.disk_write_bytes.labels(device=device).inc(write_bytes - last['write_bytes'])
-                        if read_count >= last['read_count']:
-                            self.disk_read_count.labels(device=device).inc(read_count - last['read_count'])
-                        if write_count >= last['write_count']:
-                            self.disk_write_count.labels(device=device).inc(write_count - last['write_count'])
-
-                    self.last_disk_counters[device] = {
-                        'read_bytes': read_bytes,
-                        'write_bytes': write_bytes,
-                        'read_count': read_count,
-                        'write_count': write_count
-                    }
-
-        except Exception as e:
-            print(f"Error updating disk metrics: {e}")
+            partitions = self.disk_monitor.get_all_partitions()
+            keys = [(p.get('device', 'unknown'), p.get('mountpoint', 'unknown')) for p in partitions]
+            if keys != self._partition_keys:
+                self._bind_partition_children(keys)
+
+            for children, partition in zip(self._partition_children, partitions):
+                usage = partition.get('usage', {})
+                for child, field in zip(children, _PARTITION_FIELDS):
+                    child.set(usage.get(field, 0))
+
+            # Disk I/O counters (psutil already reports monotonic totals)
+            per_disk = self.disk_monitor.get_raw_io_counters()
+            if per_disk.keys() != self._disk_io_children.keys():
+                self._bind_disk_io_children(per_disk)
+
+            for device, counters in per_disk.items():
+                for child, value in zip(self._disk_io_children[device], counters):
+                    _set_counter(child, value)
+
+        except Exception:
+            self._record_error('disk')
 
     def _update_network_metrics(self):
         """Update network metrics."""
         try:
-            network_data = self.network_monitor.get_io_counters(per_nic=True)
-
-            for interface, counters in network_data.items():
-                if interface == 'total':
-                    continue
-
-                # Skip if counters is not a dict (sometimes psutil returns strings)
-                if not isinstance(counters, dict):
-                    continue
-
-                bytes_sent = counters.get('bytes_sent', 0)
-                bytes_recv = counters.get('bytes_recv', 0)
-                packets_sent = counters.get('packets_sent', 0)
-                packets_recv = counters.get('packets_recv', 0)
-                errin = counters.get('errin', 0)
-                errout = counters.get('errout', 0)
-                dropin = counters.get('dropin', 0)
-                dropout = counters.get('dropout', 0)
-
-                # Calculate deltas and update counters
-                if interface in self.last_network_counters:
-                    last = self.last_network_counters[interface]
-                    if bytes_sent >= last['bytes_sent']:
-                        self.network_bytes_sent.labels(interface=interface).inc(bytes_sent - last['bytes_sent'])
-                    if bytes_recv >= last['bytes_recv']:
-                        self.network_bytes_recv.labels(interface=interface).inc(bytes_recv - last['bytes_recv'])
-                    if packets_sent >= last['packets_sent']:
-                        self.network_packets_sent.labels(interface=interface).inc(packets_sent - last['packets_sent'])
-                    if packets_recv >= last['packets_recv']:
-                        self.network_packets_recv.labels(interface=interface).inc(packets_recv - last['packets_recv'])
-                    if errin >= last['errin']:
-                        self.network_errors_in.labels(interface=interface).inc(errin - last['errin'])
-                    if errout >= last['errout']:
-                        self.network_errors_out.labels(interface=interface).inc(errout - last['errout'])
-                    if dropin >= last['dropin']:
-                        self.network_drops_in.labels(interface=interface).inc(dropin - last['dropin'])
-                    if dropout >= last['dropout']:
-                        self.network_drops_out.labels(interface=interface).inc(dropout - last['dropout'])
-
-                self.last_network_counters[interface] = {
-                    'bytes_sent': bytes_sent,
-                    'bytes_recv': bytes_recv,
-                    'packets_sent': packets_sent,
-                    'packets_recv': packets_recv,
-                    'errin': errin,
-                    'errout': errout,
-                    'dropin': dropin,
-                    'dropout': dropout
-                }
-
-        except Exception as e:
-            print(f"Error updating network metrics: {e}")
+            interfaces = self.network_monitor.get_raw_io_counters()
+            if interfaces.keys() != self._network_children.keys():
+                self._bind_network_children(interfaces)
+
+            for interface, counters in interfaces.items():
+                for child, value in zip(self._network_children[interface], counters):
+                    _set_counter(child, value)
+
+        except Exception:
+            self._record_error('network')
 
     def _update_gpu_metrics(self):
         """Update GPU metrics."""
@@ -310,8 +379,8 @@ class PrometheusExporter:
                     if 'fan_speed' in gpu and isinstance(gpu['fan_speed'], (int, float)):
                         self.gpu_fan_speed.labels(gpu_id=gpu_id, gpu_name=gpu_name).set(gpu['fan_speed'])
 
-        except Exception as e:
-            print(f"Error updating GPU metrics: {e}")
+        except Exception:
+            self._record_error('gpu')
 
     def generate_metrics(self) -> bytes:
         """
@@ -323,6 +392,31 @@ class PrometheusExporter:
         self.update_metrics()
         return generate_latest()
 
+    async def generate_metrics_async(self) -> bytes:
+        """
+        Generate Prometheus metrics without blocking the event loop.
+
+        Collection runs in the default executor. Scrapes that arrive while a
+        collection is in flight await that same result instead of starting
+        their own, so N concurrent scrapes cost one collection.
+
+        Returns:
+            Metrics in Prometheus text format
+        """
+        future = self._inflight
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(None, self.generate_metrics)
+            future.add_done_callback(self._clear_inflight)
+            self._inflight = future
+
+        # Shield so one cancelled scrape does not cancel the shared collection
+        return await asyncio.shield(future)
+
+    def _clear_inflight(self, future):
+        """Forget a finished in-flight collection."""
+        if self._inflight is future:
+            self._inflight = None
+
     def get_content_type(self) -> str:
         """Get the content type for Prometheus metrics."""
         return CONTENT_TYPE_LATEST
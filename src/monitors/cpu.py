@@ -1,5 +1,6 @@
 """CPU monitoring module."""
 import psutil
+from statistics import fmean
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -27,7 +28,7 @@ class CPUMonitor:
 
         stats = {
             "timestamp": datetime.now().isoformat(),
-            "usage_percent": cpu_percent if not per_cpu else sum(cpu_percent) / len(cpu_percent),
+            "usage_percent": fmean(cpu_percent) if per_cpu else cpu_percent,
             "per_cpu_percent": cpu_percent if per_cpu else None,
             "cpu_count": {
                 "physical": self.cpu_count_physical,
@@ -1,4 +1,5 @@
 """Disk monitoring module."""
+import os
 import psutil
 from typing import Dict, List
 from datetime import datetime
@@ -18,13 +19,30 @@ class DiskMonitor:
             Dictionary containing disk usage statistics
         """
         try:
-            usage = psutil.disk_usage(path)
+            if not hasattr(os, "statvfs"):
+                usage = psutil.disk_usage(path)
+                return {
+                    "path": path,
+                    "total": usage.total,
+                    "used": usage.used,
+                    "free": usage.free,
+                    "percent": usage.percent
+                }
+
+            # Same arithmetic as psutil.disk_usage on POSIX, without the
+            # namedtuple wrapper: "free" is what unprivileged users can use
+            # and "percent" is relative to that, not to the raw total.
+            st = os.statvfs(path)
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            total_user = used + free
             return {
                 "path": path,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent
+                "total": total,
+                "used": used,
+                "free": free,
+                "percent": round(used / total_user * 100, 1) if total_user else 0.0
             }
         except Exception as e:
             return {
@@ -40,8 +58,17 @@ class DiskMonitor:
             List of dictionaries containing partition information
         """
         partitions = []
+        usage_by_device = {}
         for partition in psutil.disk_partitions(all=False):
-            usage = self.get_disk_usage(partition.mountpoint)
+            # Bind mounts repeat the same device and filesystem, so reuse its
+            # usage instead of issuing another statvfs
+            cached = usage_by_device.get(partition.device)
+            if cached is not None:
+                usage = dict(cached, path=partition.mountpoint)
+            else:
+                usage = self.get_disk_usage(partition.mountpoint)
+                if "error" not in usage:
+                    usage_by_device[partition.device] = usage
             partition_info = {
                 "device": partition.device,
                 "mountpoint": partition.mountpoint,
@@ -95,6 +122,18 @@ class DiskMonitor:
                 "error": str(e)
             }
 
+    def get_raw_io_counters(self) -> Dict:
+        """
+        Get per-disk I/O counters as psutil tuples.
+
+        Unlike get_io_stats, no per-disk dicts are built and the system-wide
+        total is not queried, which keeps frequent polling cheap.
+
+        Returns:
+            Mapping of disk name to psutil sdiskio namedtuple
+        """
+        return psutil.disk_io_counters(perdisk=True) or {}
+
     def get_complete_stats(self) -> Dict:
         """
         Get complete disk statistics including partitions and I/O.
@@ -1,25 +1,101 @@
 """GPU monitoring module."""
+import atexit
+import os
+import threading
+import time
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
+# Default seconds between polls for callers that refresh GPU readings
+# continuously; NVML queries are comparatively expensive and the readings
+# move on human timescales
+DEFAULT_POLL_INTERVAL = 5.0
+
+# GPU Performance Monitoring metrics (Hopper and newer) read together by one
+# nvmlGpmMetricsGet call, as result key -> pynvml metric ID constant
+GPM_METRICS = {
+    "graphics_util": "NVML_GPM_METRIC_GRAPHICS_UTIL",
+    "sm_util": "NVML_GPM_METRIC_SM_UTIL",
+    "sm_occupancy": "NVML_GPM_METRIC_SM_OCCUPANCY",
+    "tensor_util": "NVML_GPM_METRIC_ANY_TENSOR_UTIL",
+    "dram_bw_util": "NVML_GPM_METRIC_DRAM_BW_UTIL",
+    "fp64_util": "NVML_GPM_METRIC_FP64_UTIL",
+    "fp32_util": "NVML_GPM_METRIC_FP32_UTIL",
+    "fp16_util": "NVML_GPM_METRIC_FP16_UTIL",
+}
+
+
+@lru_cache(maxsize=1)
+def init_nvml():
+    """
+    Import pynvml and call nvmlInit once per process.
+
+    Every GPU monitor and benchmark shares this initialization; shutdown is
+    registered with atexit rather than paired with each instance.
+
+    Returns:
+        The initialized pynvml module, or None if NVML is unavailable
+    """
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    atexit.register(pynvml.nvmlShutdown)
+    return pynvml
+
+
+def gpu_poll_interval(default: float = DEFAULT_POLL_INTERVAL) -> float:
+    """
+    Get the GPU polling interval, overridable through the environment.
+
+    Args:
+        default: Interval used when GPU_POLL_INTERVAL_SECONDS is not set
+
+    Returns:
+        Seconds between GPU polls
+    """
+    return float(os.environ.get("GPU_POLL_INTERVAL_SECONDS", default))
+
+
 class GPUMonitor:
     """Monitor GPU usage and statistics (supports NVIDIA primarily)."""
 
-    def __init__(self):
+    def __init__(self, poll_interval: Optional[float] = None):
+        """
+        Initialize the GPU monitor.
+
+        Args:
+            poll_interval: Seconds poll_all_gpus reuses a reading (defaults to
+                gpu_poll_interval())
+        """
+        self.poll_interval = gpu_poll_interval() if poll_interval is None else poll_interval
+        self._last_poll = None
         self.nvidia_available = False
         self.gputil_available = False
         self.gpus = []
 
+        # Per-device NVML handles and optional-query support, probed once
+        self._handles = {}
+        self._gpu_caps = {}
+        # Previous GPM sample per device; metrics are computed between polls.
+        # A per-device lock is held for the whole sample/compute/free cycle so
+        # overlapping polls never free a sample another call is still reading
+        self._gpm_samples = {}
+        self._gpm_locks = {}
+        self._gpm_locks_guard = threading.Lock()
+
         # Try to initialize NVIDIA monitoring
-        try:
-            import pynvml
-            pynvml.nvmlInit()
-            self.nvidia_available = True
-            self.pynvml = pynvml
-            self.device_count = pynvml.nvmlDeviceGetCount()
-        except (ImportError, Exception):
-            pass
+        pynvml = init_nvml()
+        if pynvml is not None:
+            try:
+                self.device_count = pynvml.nvmlDeviceGetCount()
+                self.nvidia_available = True
+                self.pynvml = pynvml
+            except Exception:
+                pass
 
         # Fallback to GPUtil
         if not self.nvidia_available:
@@ -53,50 +129,56 @@ class GPUMonitor:
             Dictionary containing GPU statistics
         """
         try:
-            handle = self.pynvml.nvmlDeviceGetHandleByIndex(device_index)
+            handle = self._handles.get(device_index)
+            if handle is None:
+                handle = self.pynvml.nvmlDeviceGetHandleByIndex(device_index)
+                self._handles[device_index] = handle
+
+            caps = self._gpu_caps.get(device_index)
+            if caps is None:
+                caps = self._probe_capabilities(handle)
+                self._gpu_caps[device_index] = caps
 
             # Get basic info
             name = self.pynvml.nvmlDeviceGetName(handle)
             if isinstance(name, bytes):
                 name = name.decode('utf-8')
 
-            # Get utilization
+            # Get utilization. GPM counters, when the device has them, also
+            # yield the SM/tensor/FP pipe and DRAM bandwidth figures; memory
+            # utilization stays the share of time memory was busy so the
+            # field keeps one meaning across polls
+            gpm = self._sample_gpm(device_index, handle) if caps["gpm"] else None
             utilization = self.pynvml.nvmlDeviceGetUtilizationRates(handle)
+            gpu_util, memory_util = utilization.gpu, utilization.memory
+            if gpm and "graphics_util" in gpm:
+                gpu_util = gpm["graphics_util"]
 
             # Get memory info
             memory = self.pynvml.nvmlDeviceGetMemoryInfo(handle)
 
-            # Get temperature
-            try:
-                temperature = self.pynvml.nvmlDeviceGetTemperature(
-                    handle, self.pynvml.NVML_TEMPERATURE_GPU
-                )
-            except:
-                temperature = None
+            # Optional queries are only issued when the device supports them
+            temperature = self.pynvml.nvmlDeviceGetTemperature(
+                handle, self.pynvml.NVML_TEMPERATURE_GPU
+            ) if caps["temperature"] else None
 
-            # Get power usage
-            try:
+            if caps["power"]:
                 power_usage = self.pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert to watts
                 power_limit = self.pynvml.nvmlDeviceGetPowerManagementLimit(handle) / 1000.0
-            except:
+            else:
                 power_usage = None
                 power_limit = None
 
-            # Get fan speed
-            try:
-                fan_speed = self.pynvml.nvmlDeviceGetFanSpeed(handle)
-            except:
-                fan_speed = None
+            fan_speed = self.pynvml.nvmlDeviceGetFanSpeed(handle) if caps["fan_speed"] else None
 
-            # Get clock speeds
-            try:
+            if caps["clocks"]:
                 graphics_clock = self.pynvml.nvmlDeviceGetClockInfo(
                     handle, self.pynvml.NVML_CLOCK_GRAPHICS
                 )
                 memory_clock = self.pynvml.nvmlDeviceGetClockInfo(
                     handle, self.pynvml.NVML_CLOCK_MEM
                 )
-            except:
+            else:
                 graphics_clock = None
                 memory_clock = None
 
@@ -104,9 +186,11 @@ class GPUMonitor:
                 "index": device_index,
                 "name": name,
                 "utilization": {
-                    "gpu": utilization.gpu,
-                    "memory": utilization.memory
+                    "gpu": gpu_util,
+                    "memory": memory_util,
+                    "memory_bandwidth": gpm.get("dram_bw_util") if gpm else None
                 },
+                "gpm": gpm,
                 "memory": {
                     "total": memory.total,
                     "used": memory.used,
@@ -131,6 +215,124 @@ class GPUMonitor:
                 "error": str(e)
             }
 
+    def _probe_capabilities(self, handle) -> Dict[str, bool]:
+        """
+        Check once which optional NVML queries a device supports.
+
+        Consumer cards commonly lack fan or power readings; probing up front
+        keeps unsupported queries (and their exceptions) off the polling path.
+
+        Args:
+            handle: NVML device handle
+
+        Returns:
+            Dictionary mapping query name to support flag
+        """
+        pynvml = self.pynvml
+        probes = {
+            "temperature": lambda: pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+            "power": lambda: (
+                pynvml.nvmlDeviceGetPowerUsage(handle),
+                pynvml.nvmlDeviceGetPowerManagementLimit(handle)
+            ),
+            "fan_speed": lambda: pynvml.nvmlDeviceGetFanSpeed(handle),
+            "clocks": lambda: (
+                pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS),
+                pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
+            )
+        }
+
+        caps = {}
+        for name, probe in probes.items():
+            try:
+                probe()
+                caps[name] = True
+            except Exception:
+                caps[name] = False
+
+        # Older pynvml releases lack the GPM bindings altogether
+        try:
+            caps["gpm"] = bool(pynvml.nvmlGpmQueryDeviceSupport(handle).isSupportedDevice)
+        except Exception:
+            caps["gpm"] = False
+        return caps
+
+    def _sample_gpm(self, device_index: int, handle) -> Optional[Dict]:
+        """
+        Take a GPM sample and compute GPM_METRICS against the previous poll's.
+
+        GPM metrics are rates between two samples; rather than sleeping
+        between two samples on every call, the interval is the time since the
+        last poll. The first poll of a device only records a sample.
+
+        Devices that advertise GPM can still refuse it (MIG instances,
+        insufficient permissions, drivers without metrics support); the first
+        NVML error disables GPM for the device so later polls fall back to
+        the plain utilization query.
+
+        Args:
+            device_index: GPU device index
+            handle: NVML device handle
+
+        Returns:
+            Dictionary of metric name to percentage, or None on the first poll
+            or when GPM is unavailable
+        """
+        with self._gpm_locks_guard:
+            lock = self._gpm_locks.setdefault(device_index, threading.Lock())
+
+        pynvml = self.pynvml
+        with lock:
+            try:
+                return self._sample_gpm_locked(device_index, handle)
+            except pynvml.NVMLError:
+                self._gpu_caps[device_index]["gpm"] = False
+                stale = self._gpm_samples.pop(device_index, None)
+                if stale is not None:
+                    pynvml.nvmlGpmSampleFree(stale)
+                return None
+
+    def _sample_gpm_locked(self, device_index: int, handle) -> Optional[Dict]:
+        """
+        Body of _sample_gpm; the caller holds the device's GPM lock.
+
+        Args:
+            device_index: GPU device index
+            handle: NVML device handle
+
+        Returns:
+            Dictionary of metric name to percentage, or None on the first poll
+        """
+        pynvml = self.pynvml
+        sample = pynvml.nvmlGpmSampleAlloc()
+        try:
+            pynvml.nvmlGpmSampleGet(handle, sample)
+        except Exception:
+            pynvml.nvmlGpmSampleFree(sample)
+            raise
+
+        previous = self._gpm_samples.get(device_index)
+        self._gpm_samples[device_index] = sample
+        if previous is None:
+            return None
+
+        try:
+            request = pynvml.c_nvmlGpmMetricsGet_t()
+            request.version = pynvml.NVML_GPM_METRICS_GET_VERSION
+            request.numMetrics = len(GPM_METRICS)
+            request.sample1 = previous
+            request.sample2 = sample
+            for i, metric in enumerate(GPM_METRICS.values()):
+                request.metrics[i].metricId = getattr(pynvml, metric)
+            pynvml.nvmlGpmMetricsGet(request)
+            return {
+                name: request.metrics[i].value
+                for i, name in enumerate(GPM_METRICS)
+                if request.metrics[i].nvmlReturn == pynvml.NVML_SUCCESS
+            }
+        finally:
+            pynvml.nvmlGpmSampleFree(previous)
+
     def get_gpu_info_gputil(self, device_index: int = 0) -> Dict:
         """
         Get GPU information using GPUtil (NVIDIA fallback).
@@ -170,6 +372,21 @@ class GPUMonitor:
                 "error": str(e)
             }
 
+    def poll_all_gpus(self) -> Dict:
+        """
+        Get information for all GPUs, reusing the last reading within poll_interval.
+
+        For loops that refresh faster than GPU readings are worth querying
+        (e.g. a dashboard redrawing every second).
+
+        Returns:
+            Dictionary containing all GPU statistics
+        """
+        now = time.monotonic()
+        if self._last_poll is None or now - self._last_poll[0] >= self.poll_interval:
+            self._last_poll = (now, self.get_all_gpus())
+        return self._last_poll[1]
+
     def get_all_gpus(self) -> Dict:
         """
         Get information for all available GPUs.
@@ -213,11 +430,3 @@ class GPUMonitor:
             except:
                 return None
         return None
-
-    def __del__(self):
-        """Cleanup NVML resources."""
-        if self.nvidia_available:
-            try:
-                self.pynvml.nvmlShutdown()
-            except:
-                pass
\ No newline at end of file
@@ -1,13 +1,26 @@
 """Advanced GPU stress testing and benchmarking suite."""
+import asyncio
 import time
-import json
 import csv
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 from datetime import datetime
 import numpy as np
 
+from .gpu import init_nvml
+from .gpu_benchmark import release_cuda_memory
+from ..storage.exporter import to_json_bytes
+
+
+# Per-sample metrics recorded by monitor_gpu_metrics, in CSV column order.
+# Optional fields an NVML build cannot report are stored as NaN.
+METRIC_FIELDS = (
+    'timestamp', 'temperature', 'power_usage', 'utilization', 'memory_utilization',
+    'memory_used_mb', 'memory_free_mb', 'gpu_clock_mhz', 'memory_clock_mhz', 'performance_state'
+)
+
 
 class GPUStressBenchmark:
     """Advanced GPU stress testing and benchmarking tool."""
@@ -17,8 +30,9 @@ class GPUStressBenchmark:
         self.torch_available = False
         self.pynvml_available = False
         self.gpu_count = 0
-        self.metrics_history = []
         self.stop_monitoring = threading.Event()
+        self._nvml_handles = {}
+        self._reset_metrics()
 
         # Try to import PyTorch
         try:
@@ -30,16 +44,16 @@ class GPUStressBenchmark:
         except ImportError:
             pass
 
-        # Try to import pynvml
-        try:
-            import pynvml
-            pynvml.nvmlInit()
+        # NVML is initialized once per process and shared
+        pynvml = init_nvml()
+        if pynvml is not None:
             self.pynvml = pynvml
             self.pynvml_available = True
-            if not self.torch_available and self.pynvml_available:
-                self.gpu_count = pynvml.nvmlDeviceGetCount()
-        except:
-            pass
+            if not self.torch_available:
+                try:
+                    self.gpu_count = pynvml.nvmlDeviceGetCount()
+                except:
+                    pass
 
     def is_available(self) -> bool:
         """
@@ -55,74 +69,203 @@ class GPUStressBenchmark:
         """Check if CUDA is available."""
         return self.torch_available
 
-    def monitor_gpu_metrics(self, device_id: int = 0, interval: float = 0.5):
+    def _get_nvml_handle(self, device_id: int):
+        """Get the cached NVML handle for a GPU index."""
+        if device_id not in self._nvml_handles:
+            self._nvml_handles[device_id] = self.pynvml.nvmlDeviceGetHandleByIndex(device_id)
+        return self._nvml_handles[device_id]
+
+    def _reset_metrics(self, capacity: int = 1024):
+        """
+        Clear recorded metrics and preallocate one column per field.
+
+        Args:
+            capacity: Expected number of samples (columns grow if exceeded)
+        """
+        self._metrics_arrays = {field: np.empty(capacity, dtype=np.float64) for field in METRIC_FIELDS}
+        self._metrics_n = 0
+
+    def _record_metrics(self, sample: Dict):
+        """Append one sample, writing each field into its column by index."""
+        n = self._metrics_n
+        if n == len(self._metrics_arrays['timestamp']):
+            for field, column in self._metrics_arrays.items():
+                self._metrics_arrays[field] = np.concatenate((column, np.empty_like(column)))
+        for field in METRIC_FIELDS:
+            self._metrics_arrays[field][n] = sample.get(field, np.nan)
+        self._metrics_n = n + 1
+
+    def _metric(self, field: str) -> np.ndarray:
+        """View of the recorded samples for one field."""
+        return self._metrics_arrays[field][:self._metrics_n]
+
+    @property
+    def metrics_history(self) -> List[Dict]:
+        """Recorded samples as a list of dicts (fields that were unavailable are omitted)."""
+        columns = [(field, self._metric(field).tolist()) for field in METRIC_FIELDS]
+        return [
+            {field: values[i] for field, values in columns if values[i] == values[i]}
+            for i in range(self._metrics_n)
+        ]
+
+    def monitor_gpu_metrics(self, device_id: int = 0, interval: float = 0.5,
+                            csv_path: Optional[str] = None):
         """
         Background thread to monitor GPU metrics during benchmarks.
 
         Args:
             device_id: GPU device ID
             interval: Sampling interval in seconds
+            csv_path: Also write each sample to this CSV file as it is taken
         """
         if not self.pynvml_available:
             return
 
-        handle = self.pynvml.nvmlDeviceGetHandleByIndex(device_id)
+        if csv_path:
+            Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(csv_path, 'w', newline='') as csv_sink:
+                self._monitor_loop(device_id, interval, csv_sink)
+        else:
+            self._monitor_loop(device_id, interval)
+
+    def _monitor_loop(self, device_id: int, interval: float, csv_sink=None):
+        """
+        Sample NVML metrics until stop_monitoring is set.
+
+        Args:
+            device_id: GPU device ID
+            interval: Sampling interval in seconds
+            csv_sink: Open text file that receives one CSV row per sample
+        """
+        writer = None
+        if csv_sink is not None:
+            writer = csv.writer(csv_sink)
+            writer.writerow(METRIC_FIELDS)
+        flush_every = 32
+
+        pynvml = self.pynvml
+        handle = self._get_nvml_handle(device_id)
+        # Optional queries that fail once are unsupported; stop issuing them
+        clocks_supported = True
+        pstate_supported = True
+        # Samples are scheduled on fixed deadlines so NVML latency does not
+        # accumulate as drift
+        next_sample = time.monotonic()
 
         while not self.stop_monitoring.is_set():
             try:
+                # One utilization query serves both the GPU and memory rates
+                rates = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
                 metrics = {
                     'timestamp': time.time(),
-                    'temperature': self.pynvml.nvmlDeviceGetTemperature(
-                        handle, self.pynvml.NVML_TEMPERATURE_GPU
-                    ),
-                    'power_usage': self.pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0,
-                    'utilization': self.pynvml.nvmlDeviceGetUtilizationRates(handle).gpu,
-                    'memory_utilization': self.pynvml.nvmlDeviceGetUtilizationRates(handle).memory,
+                    'temperature': pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+                    'power_usage': pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0,
+                    'utilization': rates.gpu,
+                    'memory_utilization': rates.memory,
+                    'memory_used_mb': memory.used / (1024**2),
+                    'memory_free_mb': memory.free / (1024**2)
                 }
 
-                # Get memory info
-                memory = self.pynvml.nvmlDeviceGetMemoryInfo(handle)
-                metrics['memory_used_mb'] = memory.used / (1024**2)
-                metrics['memory_free_mb'] = memory.free / (1024**2)
-
                 # Get clock speeds
-                try:
-                    metrics['gpu_clock_mhz'] = self.pynvml.nvmlDeviceGetClockInfo(
-                        handle, self.pynvml.NVML_CLOCK_GRAPHICS
-                    )
-                    metrics['memory_clock_mhz'] = self.pynvml.nvmlDeviceGetClockInfo(
-                        handle, self.pynvml.NVML_CLOCK_MEM
-                    )
-                except:
-                    pass
+                if clocks_supported:
+                    try:
+                        metrics['gpu_clock_mhz'] = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)
+                        metrics['memory_clock_mhz'] = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
+                    except:
+                        clocks_supported = False
 
                 # Check for throttling
-                try:
-                    perf_state = self.pynvml.nvmlDeviceGetPerformanceState(handle)
-                    metrics['performance_state'] = perf_state
-                except:
-                    pass
-
-                self.metrics_history.append(metrics)
+                if pstate_supported:
+                    try:
+                        metrics['performance_state'] = pynvml.nvmlDeviceGetPerformanceState(handle)
+                    except:
+                        pstate_supported = False
+
+                self._record_metrics(metrics)
+                if writer is not None:
+                    writer.writerow([metrics.get(field, '') for field in METRIC_FIELDS])
+                    if self._metrics_n % flush_every == 0:
+                        csv_sink.flush()
 
             except Exception as e:
                 print(f"Error monitoring metrics: {e}")
 
-            time.sleep(interval)
+            next_sample += interval
+            delay = next_sample - time.monotonic()
+            if delay > 0:
+                if self.stop_monitoring.wait(delay):
+                    break
+            else:
+                # Overran a whole period; restart the schedule rather than burst
+                next_sample = time.monotonic()
+
+    def _time_matmuls(self, a, b, iterations: int) -> float:
+        """
+        Time back-to-back matmuls of a and b with CUDA events.
+
+        Args:
+            a: Left operand on the target device
+            b: Right operand on the target device
+            iterations: Number of matmuls
+
+        Returns:
+            Elapsed GPU time in seconds
+        """
+        # Events record on the current device's stream, which must be a's
+        with self.torch.cuda.device(a.device):
+            start = self.torch.cuda.Event(enable_timing=True)
+            end = self.torch.cuda.Event(enable_timing=True)
+            start.record()
+            for _ in range(iterations):
+                self.torch.matmul(a, b)
+            end.record()
+            end.synchronize()
+        return start.elapsed_time(end) / 1000.0
+
+    def _calibrate(self, a, b, min_seconds: float = 0.2) -> float:
+        """
+        Measure the matmul rate of a and b, running for at least min_seconds.
+
+        Batches double until the accumulated GPU time reaches min_seconds, so
+        the probe also serves as the warmup for the timed run.
+
+        Args:
+            a: Left operand on the target device
+            b: Right operand on the target device
+            min_seconds: Minimum GPU time to spend probing
+
+        Returns:
+            Matmuls per second
+        """
+        done = 0
+        elapsed = 0.0
+        batch = 1
+        while elapsed < min_seconds:
+            elapsed += self._time_matmuls(a, b, batch)
+            done += batch
+            batch *= 2
+        return done / elapsed
 
     def benchmark_mixed_precision(
         self,
         device_id: int = 0,
         size: int = 8192,
-        iterations: int = 100
+        iterations: int = 100,
+        fp16_reduced_accum: bool = True,
+        target_seconds: Optional[float] = None
     ) -> Dict:
         """
-        Benchmark mixed precision performance (FP32, FP16, BF16).
+        Benchmark mixed precision performance (FP32, TF32, FP16, BF16).
 
         Args:
             device_id: GPU device ID
             size: Matrix size
             iterations: Number of iterations
+            fp16_reduced_accum: Let cuBLAS use reduced-precision reductions for
+                the FP16 and BF16 matmuls (faster; FP32 reductions when False)
+            target_seconds: Time budget per precision; slower precisions run
+                fewer than `iterations` matmuls (at least 10) to fit it
 
         Returns:
             Benchmark results
@@ -139,73 +282,124 @@ class GPUStressBenchmark:
             "precisions": {}
         }
 
-        # FP32 (Float32)
-        print(f"Testing FP32 precision...")
+        flops_per_matmul = 2 * size ** 3
+
+        def run_leg(a, b):
+            """Time one precision, sizing the run to target_seconds if given."""
+            n = iterations
+            if target_seconds is not None:
+                # The calibration probe doubles as the warmup
+                rate = self._calibrate(a, b)
+                n = min(iterations, max(10, int(rate * target_seconds)))
+            else:
+                # Keep cuBLAS heuristics and handle setup out of the timed run
+                self._time_matmuls(a, b, 3)
+            return self._time_matmuls(a, b, n), n
+
+        def leg_result(elapsed, n, baseline=None):
+            leg = {
+                "iterations": n,
+                "total_time_seconds": elapsed,
+                "avg_time_ms": (elapsed / n) * 1000,
+                "tflops": (flops_per_matmul * n) / (elapsed * 1e12)
+            }
+            if baseline is not None:
+                leg["speedup_vs_fp32"] = baseline["avg_time_ms"] / leg["avg_time_ms"]
+            return leg
+
+        # FP32 (Float32) on IEEE CUDA cores, then through TF32 Tensor Cores.
+        # The TF32 switches are process-wide, so they are restored afterwards.
+        tf32_flags = (
+            self.torch.backends.cuda.matmul.allow_tf32,
+            self.torch.backends.cudnn.allow_tf32
+        )
         a_fp32 = self.torch.randn(size, size, device=device, dtype=self.torch.float32)
         b_fp32 = self.torch.randn(size, size, device=device, dtype=self.torch.float32)
 
-        self.torch.cuda.synchronize()
-        start = time.time()
-        for _ in range(iterations):
-            c = self.torch.matmul(a_fp32, b_fp32)
-        self.torch.cuda.synchronize()
-        fp32_time = time.time() - start
-
-        fp32_tflops = (2 * size ** 3 * iterations) / (fp32_time * 1e12)
-        results["precisions"]["fp32"] = {
-            "total_time_seconds": fp32_time,
-            "avg_time_ms": (fp32_time / iterations) * 1000,
-            "tflops": fp32_tflops
-        }
+        try:
+            print(f"Testing FP32 precision...")
+            self.torch.backends.cuda.matmul.allow_tf32 = False
+            self.torch.backends.cudnn.allow_tf32 = False
 
-        # FP16 (Float16)
-        print(f"Testing FP16 precision...")
-        a_fp16 = self.torch.randn(size, size, device=device, dtype=self.torch.float16)
-        b_fp16 = self.torch.randn(size, size, device=device, dtype=self.torch.float16)
-
-        self.torch.cuda.synchronize()
-        start = time.time()
-        for _ in range(iterations):
-            c = self.torch.matmul(a_fp16, b_fp16)
-        self.torch.cuda.synchronize()
-        fp16_time = time.time() - start
-
-        fp16_tflops = (2 * size ** 3 * iterations) / (fp16_time * 1e12)
-        results["precisions"]["fp16"] = {
-            "total_time_seconds": fp16_time,
-            "avg_time_ms": (fp16_time / iterations) * 1000,
-            "tflops": fp16_tflops,
-            "speedup_vs_fp32": fp32_time / fp16_time
-        }
+            fp32_time, fp32_iters = run_leg(a_fp32, b_fp32)
+
+            print(f"Testing TF32 precision...")
+            self.torch.backends.cuda.matmul.allow_tf32 = True
+            self.torch.backends.cudnn.allow_tf32 = True
+
+            tf32_time, tf32_iters = run_leg(a_fp32, b_fp32)
+        finally:
+            self.torch.backends.cuda.matmul.allow_tf32, self.torch.backends.cudnn.allow_tf32 = tf32_flags
+
+        fp32 = results["precisions"]["fp32"] = leg_result(fp32_time, fp32_iters)
+        results["precisions"]["tf32"] = leg_result(tf32_time, tf32_iters, baseline=fp32)
+
+        # Half precision only has Tensor Core support from Volta (FP16) and
+        # Ampere (BF16); older parts emulate it and would report a slowdown
+        major, minor = self.torch.cuda.get_device_capability(device_id)
+
+        # Only one operand pair is ever live: each precision is converted from
+        # the previous pair one matrix at a time, and the old one released
+        operands = [a_fp32, b_fp32]
+        del a_fp32, b_fp32
+
+        def convert(dtype):
+            for i, matrix in enumerate(operands):
+                operands[i] = matrix.to(dtype)
+                del matrix
+            self.torch.cuda.empty_cache()
+            return operands
+
+        # Half-precision reduction switches are process-wide as well
+        matmul_backend = self.torch.backends.cuda.matmul
+        reduction_flags = (
+            matmul_backend.allow_fp16_reduced_precision_reduction,
+            matmul_backend.allow_bf16_reduced_precision_reduction
+        )
+        matmul_backend.allow_fp16_reduced_precision_reduction = fp16_reduced_accum
+        matmul_backend.allow_bf16_reduced_precision_reduction = fp16_reduced_accum
+        results["fp16_reduced_accum"] = fp16_reduced_accum
 
-        # BF16 (BFloat16) - if supported
         try:
-            print(f"Testing BF16 precision...")
-            a_bf16 = self.torch.randn(size, size, device=device, dtype=self.torch.bfloat16)
-            b_bf16 = self.torch.randn(size, size, device=device, dtype=self.torch.bfloat16)
+            # FP16 (Float16)
+            if major < 7:
+                results["precisions"]["fp16"] = {
+                    "skipped": "FP16 tensor cores require compute capability 7.0+"
+                }
+            else:
+                print(f"Testing FP16 precision...")
+                a_fp16, b_fp16 = convert(self.torch.float16)
 
-            self.torch.cuda.synchronize()
-            start = time.time()
-            for _ in range(iterations):
-                c = self.torch.matmul(a_bf16, b_bf16)
-            self.torch.cuda.synchronize()
-            bf16_time = time.time() - start
-
-            bf16_tflops = (2 * size ** 3 * iterations) / (bf16_time * 1e12)
-            results["precisions"]["bf16"] = {
-                "total_time_seconds": bf16_time,
-                "avg_time_ms": (bf16_time / iterations) * 1000,
-                "tflops": bf16_tflops,
-                "speedup_vs_fp32": fp32_time / bf16_time
-            }
-        except Exception as e:
-            results["precisions"]["bf16"] = {"error": str(e)}
+                fp16_time, fp16_iters = run_leg(a_fp16, b_fp16)
+                results["precisions"]["fp16"] = leg_result(fp16_time, fp16_iters, baseline=fp32)
+
+            # BF16 (BFloat16) - if supported
+            if major < 8:
+                results["precisions"]["bf16"] = {
+                    "skipped": "BF16 tensor cores require compute capability 8.0+"
+                }
+            else:
+                try:
+                    print(f"Testing BF16 precision...")
+                    if 'a_fp16' in locals():
+                        del a_fp16, b_fp16
+                    a_bf16, b_bf16 = convert(self.torch.bfloat16)
+
+                    bf16_time, bf16_iters = run_leg(a_bf16, b_bf16)
+                    results["precisions"]["bf16"] = leg_result(bf16_time, bf16_iters, baseline=fp32)
+                except Exception as e:
+                    results["precisions"]["bf16"] = {"error": str(e)}
+        finally:
+            (matmul_backend.allow_fp16_reduced_precision_reduction,
+             matmul_backend.allow_bf16_reduced_precision_reduction) = reduction_flags
 
         # Cleanup
-        del a_fp32, b_fp32, a_fp16, b_fp16
+        if 'a_fp16' in locals():
+            del a_fp16, b_fp16
         if 'a_bf16' in locals():
             del a_bf16, b_bf16
-        self.torch.cuda.empty_cache()
+        del operands
+        release_cuda_memory(self.torch)
 
         return results
 
@@ -213,7 +407,8 @@ class GPUStressBenchmark:
         self,
         device_id: int = 0,
         fill_percentage: float = 90.0,
-        duration_seconds: int = 60
+        duration_seconds: int = 60,
+        metrics_csv: Optional[str] = None
     ) -> Dict:
         """
         Stress test GPU memory by filling it and running operations.
@@ -222,6 +417,7 @@ class GPUStressBenchmark:
             device_id: GPU device ID
             fill_percentage: Percentage of memory to fill
             duration_seconds: Duration of stress test
+            metrics_csv: Stream monitor samples to this CSV file while running
 
         Returns:
             Stress test results
@@ -246,27 +442,36 @@ class GPUStressBenchmark:
 
         print(f"Allocating {target_memory / (1024**3):.2f} GB of GPU memory...")
 
-        # Allocate tensors to fill memory
+        # Fill memory with one allocation, split into 100 MB views
         tensors = []
-        allocated = 0
         tensor_size = 100 * 1024 * 1024  # 100 MB chunks
+        monitor_thread = None
 
         try:
-            while allocated < target_memory:
-                remaining = target_memory - allocated
-                current_size = min(tensor_size, remaining) // 4  # 4 bytes per float32
-                tensor = self.torch.randn(current_size, device=device)
-                tensors.append(tensor)
-                allocated += current_size * 4
+            numel = target_memory // 4  # 4 bytes per float32
+            chunk = tensor_size // 4
+            big = self.torch.empty(numel, dtype=self.torch.float32, device=device)
+            big.uniform_()  # One fill kernel so the views hold ordinary floats
+            # The first chunk is the preallocated output, so the loop never
+            # allocates and the whole footprint stays inside the target
+            out_numel = min(chunk, numel // 2)
+            out = big.narrow(0, 0, out_numel)
+            # Only full-size views, so every operand matches the output shape;
+            # the ragged tail past the last whole chunk is left unused
+            tensors = [
+                big.narrow(0, start, out_numel)
+                for start in range(out_numel, numel - out_numel + 1, out_numel)
+            ]
+            allocated = numel * 4
 
             print(f"Allocated {allocated / (1024**3):.2f} GB")
 
             # Start monitoring
-            self.metrics_history = []
+            self._reset_metrics(int(duration_seconds / 0.5) + 16)
             self.stop_monitoring.clear()
             monitor_thread = threading.Thread(
                 target=self.monitor_gpu_metrics,
-                args=(device_id, 0.5)
+                args=(device_id, 0.5, metrics_csv)
             )
             monitor_thread.start()
 
@@ -275,13 +480,22 @@ class GPUStressBenchmark:
             end_time = time.time() + duration_seconds
             operations = 0
 
+            # Random operand pairs are drawn in batches rather than two
+            # randint calls per operation
+            schedule_size = 65536
+            schedule = []
+            position = schedule_size
+
             while time.time() < end_time:
                 # Random memory operations
-                idx1 = np.random.randint(0, len(tensors))
-                idx2 = np.random.randint(0, len(tensors))
+                if position == schedule_size:
+                    schedule = np.random.randint(0, len(tensors), size=(schedule_size, 2)).tolist()
+                    position = 0
+                idx1, idx2 = schedule[position]
+                position += 1
 
                 # Perform operations that stress memory bandwidth
-                _ = tensors[idx1] + tensors[idx2][:len(tensors[idx1])]
+                self.torch.add(tensors[idx1], tensors[idx2], out=out)
                 operations += 1
 
             self.torch.cuda.synchronize()
@@ -289,6 +503,7 @@ class GPUStressBenchmark:
             # Stop monitoring
             self.stop_monitoring.set()
             monitor_thread.join()
+            monitor_thread = None
 
             results["operations_completed"] = operations
             results["metrics"] = self._analyze_metrics()
@@ -296,9 +511,17 @@ class GPUStressBenchmark:
         except Exception as e:
             results["error"] = str(e)
         finally:
+            # Never leave the sampler running into the next benchmark
+            if monitor_thread is not None:
+                self.stop_monitoring.set()
+                monitor_thread.join()
             # Cleanup
             del tensors
-            self.torch.cuda.empty_cache()
+            if 'out' in locals():
+                del out
+            if 'big' in locals():
+                del big
+            release_cuda_memory(self.torch)
 
         return results
 
@@ -306,7 +529,8 @@ class GPUStressBenchmark:
         self,
         device_id: int = 0,
         duration_minutes: int = 10,
-        workload_intensity: str = "high"
+        workload_intensity: str = "high",
+        metrics_csv: Optional[str] = None
     ) -> Dict:
         """
         Run sustained load benchmark to test thermal throttling and stability.
@@ -315,6 +539,7 @@ class GPUStressBenchmark:
             device_id: GPU device ID
             duration_minutes: Test duration in minutes
             workload_intensity: "low", "medium", "high", or "extreme"
+            metrics_csv: Stream monitor samples to this CSV file while running
 
         Returns:
             Sustained load results
@@ -349,18 +574,82 @@ class GPUStressBenchmark:
         print("This will push the GPU to maximum utilization...")
 
         # Start monitoring
-        self.metrics_history = []
+        self._reset_metrics(int(duration_seconds / 1.0) + 16)
         self.stop_monitoring.clear()
         monitor_thread = threading.Thread(
             target=self.monitor_gpu_metrics,
-            args=(device_id, 1.0)  # Sample every second
+            args=(device_id, 1.0, metrics_csv)  # Sample every second
         )
         monitor_thread.start()
 
         try:
-            # Allocate matrices
+            # Allocate matrices once; the loop writes into them in place so it
+            # never touches the RNG or the allocator
             a = self.torch.randn(size, size, device=device)
             b = self.torch.randn(size, size, device=device)
+            c = self.torch.empty_like(a)
+
+            torch = self.torch
+
+            def eager_step(x, y, out):
+                torch.matmul(x, y, out=out)
+                torch.sin(out, out=out)
+
+            def fused_step(x, y, out):
+                out.copy_(torch.sin(torch.matmul(x, y)))
+
+            # Compiled with autotuned Triton matmul templates, sin becomes an
+            # epilogue and the product never round-trips through memory. No
+            # compiler-side CUDA graphs: the whole batch is captured below.
+            steps = [(eager_step, False)]
+            if hasattr(torch, 'compile'):
+                try:
+                    compiled = torch.compile(fused_step, mode="max-autotune-no-cudagraphs", fullgraph=True)
+                    compiled(a, b, c)  # Compile and autotune outside capture
+                    steps.insert(0, (compiled, True))
+                except Exception:
+                    pass
+
+            def capture(step):
+                def batch():
+                    # Ping-pong between a and c so each step consumes the last result
+                    for i in range(batch_ops):
+                        if i % 2 == 0:
+                            step(a, b, c)
+                        else:
+                            step(c, b, a)
+
+                # Capture one batch into a CUDA graph so each batch is a single
+                # launch; warm up on the capture stream first so cuBLAS has its
+                # workspace before capture
+                with torch.cuda.device(device):
+                    capture_stream = torch.cuda.Stream()
+                    capture_stream.wait_stream(torch.cuda.current_stream())
+                    with torch.cuda.stream(capture_stream):
+                        batch()
+                    torch.cuda.current_stream().wait_stream(capture_stream)
+
+                    batch_graph = torch.cuda.CUDAGraph()
+                    with torch.cuda.graph(batch_graph, stream=capture_stream):
+                        batch()
+                torch.cuda.synchronize(device)
+                return batch_graph
+
+            for step, fused in steps:
+                try:
+                    graph = capture(step)
+                    break
+                except Exception:
+                    if not fused:
+                        raise
+            results["fused_matmul_sin"] = fused
+
+            # Replays are queued asynchronously, so the GPU keeps working after
+            # the host loop ends; the rate comes from events on the GPU timeline
+            replay_stream = torch.cuda.current_stream(device)
+            gpu_start = torch.cuda.Event(enable_timing=True)
+            gpu_end = torch.cuda.Event(enable_timing=True)
+            gpu_start.record(replay_stream)
 
             end_time = time.time() + duration_seconds
             iterations = 0
@@ -368,10 +657,8 @@ class GPUStressBenchmark:
 
             while time.time() < end_time:
                 # Batch operations to maximize utilization
-                for _ in range(batch_ops):
-                    c = self.torch.matmul(a, b)
-                    a = self.torch.sin(c)
-                    iterations += 1
+                graph.replay()
+                iterations += batch_ops
 
                 # Print progress every minute
                 elapsed = time.time() - start_time
@@ -380,7 +667,9 @@ class GPUStressBenchmark:
                     print(f"  Progress: {elapsed/60:.1f}/{duration_minutes} minutes, "
                           f"{remaining:.1f} minutes remaining")
 
+            gpu_end.record(replay_stream)
             self.torch.cuda.synchronize()
+            gpu_seconds = gpu_start.elapsed_time(gpu_end) / 1000
 
             # Stop monitoring
             self.stop_monitoring.set()
@@ -388,12 +677,13 @@ class GPUStressBenchmark:
 
             results["iterations_completed"] = iterations
             results["metrics"] = self._analyze_metrics()
-            results["avg_iterations_per_second"] = iterations / duration_seconds
+            results["gpu_seconds"] = gpu_seconds
+            results["avg_iterations_per_second"] = iterations / gpu_seconds if gpu_seconds else 0.0
 
             # Check for throttling
-            if self.metrics_history:
-                temps = [m['temperature'] for m in self.metrics_history]
-                results["thermal_throttling_detected"] = max(temps) > 85  # Typical throttle point
+            if self._metrics_n:
+                temps = self._metric('temperature')
+                results["thermal_throttling_detected"] = bool(temps.max() > 85)  # Typical throttle point
 
         except Exception as e:
             results["error"] = str(e)
@@ -401,9 +691,11 @@ class GPUStressBenchmark:
             monitor_thread.join()
         finally:
             # Cleanup
+            if 'graph' in locals():
+                del graph
             if 'a' in locals():
                 del a, b, c
-            self.torch.cuda.empty_cache()
+            release_cuda_memory(self.torch)
 
         return results
 
@@ -411,6 +703,18 @@ class GPUStressBenchmark:
         """
         Benchmark all available GPUs simultaneously.
 
+        Args:
+            duration_seconds: Test duration
+
+        Returns:
+            Multi-GPU benchmark results
+        """
+        return asyncio.run(self.benchmark_multi_gpu_async(duration_seconds))
+
+    async def benchmark_multi_gpu_async(self, duration_seconds: int = 60) -> Dict:
+        """
+        Benchmark all available GPUs simultaneously from a running event loop.
+
         Args:
             duration_seconds: Test duration
 
@@ -432,50 +736,81 @@ class GPUStressBenchmark:
 
         print(f"Running multi-GPU benchmark on {self.gpu_count} GPUs...")
 
-        def gpu_workload(gpu_id: int):
-            """Workload for a single GPU."""
-            device = self.torch.device(f'cuda:{gpu_id}')
-            size = 4096
-
-            a = self.torch.randn(size, size, device=device)
-            b = self.torch.randn(size, size, device=device)
-
-            end_time = time.time() + duration_seconds
-            iterations = 0
-
-            while time.time() < end_time:
-                c = self.torch.matmul(a, b)
-                a = self.torch.sin(c)
-                iterations += 1
-
-            self.torch.cuda.synchronize(device)
-            return iterations
-
-        # Run on all GPUs in parallel
-        threads = []
-        gpu_results = {}
-
-        for gpu_id in range(self.gpu_count):
-            def worker(gid=gpu_id):
-                gpu_results[gid] = gpu_workload(gid)
-
-            thread = threading.Thread(target=worker)
-            thread.start()
-            threads.append(thread)
-
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        # One waiter thread per GPU: the shared default executor can be
+        # smaller than the GPU count, which would hold back some devices' next chunk
+        end_time = time.time() + duration_seconds
+        with ThreadPoolExecutor(max_workers=self.gpu_count) as waiters:
+            gpu_results = await asyncio.gather(
+                *(self._multi_gpu_worker(gpu_id, end_time, waiters) for gpu_id in range(self.gpu_count))
+            )
 
         # Collect results
-        for gpu_id, iterations in gpu_results.items():
+        for gpu_id, (iterations, elapsed) in enumerate(gpu_results):
             results["gpus"][f"gpu_{gpu_id}"] = {
                 "iterations": iterations,
-                "avg_iterations_per_second": iterations / duration_seconds
+                "elapsed_seconds": elapsed,
+                "avg_iterations_per_second": iterations / elapsed if elapsed else 0.0
             }
 
         return results
 
+    async def _multi_gpu_worker(self, gpu_id: int, end_time: float,
+                                waiters: ThreadPoolExecutor, chunk: int = 100):
+        """
+        Keep one GPU busy on its own stream until end_time.
+
+        All workers launch from the event loop's thread (launches return
+        immediately) and wait for their chunks off-thread, so one chunk is
+        always queued behind the one executing and no GPU waits on another's
+        Python dispatch.
+
+        Args:
+            gpu_id: GPU device ID
+            end_time: Wall-clock time (time.time()) to stop issuing work
+            waiters: Executor that blocks on chunk completion events
+            chunk: matmul+sin steps per completion event
+
+        Returns:
+            Tuple of (completed iterations, GPU seconds from the first launch
+            to the last completed chunk)
+        """
+        device = self.torch.device(f'cuda:{gpu_id}')
+        size = 4096
+
+        a = self.torch.randn(size, size, device=device)
+        b = self.torch.randn(size, size, device=device)
+        c = self.torch.empty_like(a)
+        stream = self.torch.cuda.Stream(device=device)
+        # Operands come from the default stream; order the worker stream after them
+        stream.wait_stream(self.torch.cuda.current_stream(device))
+
+        loop = asyncio.get_running_loop()
+        start = self.torch.cuda.Event(enable_timing=True)
+        start.record(stream)
+        last = start
+        iterations = 0
+        pending = None
+        while True:
+            launch = time.time() < end_time
+            if launch:
+                with self.torch.cuda.device(device), self.torch.cuda.stream(stream):
+                    for _ in range(chunk):
+                        self.torch.matmul(a, b, out=c)
+                        self.torch.sin(c, out=a)
+                    done = self.torch.cuda.Event(enable_timing=True)
+                    done.record(stream)
+            if pending is not None:
+                await loop.run_in_executor(waiters, pending.synchronize)
+                iterations += chunk
+                last = pending
+            if not launch:
+                break
+            pending = done
+
+        if last is start:
+            return iterations, 0.0
+        return iterations, start.elapsed_time(last) / 1000
+
     def run_benchmark_suite(
         self,
         device_id: int = 0,
@@ -495,17 +830,17 @@ class GPUStressBenchmark:
             "quick": {
                 "mixed_precision": {"size": 4096, "iterations": 50},
                 "memory_stress": {"fill_percentage": 80, "duration_seconds": 30},
-                "sustained_load": {"duration_minutes": 2, "intensity": "medium"}
+                "sustained_load": {"duration_minutes": 2, "workload_intensity": "medium"}
             },
             "standard": {
                 "mixed_precision": {"size": 8192, "iterations": 100},
                 "memory_stress": {"fill_percentage": 90, "duration_seconds": 60},
-                "sustained_load": {"duration_minutes": 5, "intensity": "high"}
+                "sustained_load": {"duration_minutes": 5, "workload_intensity": "high"}
             },
             "comprehensive": {
-                "mixed_precision": {"size": 16384, "iterations": 200},
+                "mixed_precision": {"size": 16384, "iterations": 200, "target_seconds": 10},
                 "memory_stress": {"fill_percentage": 95, "duration_seconds": 120},
-                "sustained_load": {"duration_minutes": 10, "intensity": "extreme"}
+                "sustained_load": {"duration_minutes": 10, "workload_intensity": "extreme"}
             }
         }
 
@@ -572,48 +907,41 @@ class GPUStressBenchmark:
         # JSON export
         if "json" in formats:
             json_file = output_path / f"benchmark_{timestamp}.json"
-            with open(json_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            with open(json_file, 'wb') as f:
+                f.write(to_json_bytes(results))
             filepaths["json"] = str(json_file)
 
         # CSV export (metrics history)
-        if "csv" in formats and self.metrics_history:
+        if "csv" in formats and self._metrics_n:
             csv_file = output_path / f"metrics_{timestamp}.csv"
+            columns = [
+                ['' if value != value else value for value in self._metric(field).tolist()]
+                for field in METRIC_FIELDS
+            ]
             with open(csv_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.metrics_history[0].keys())
-                writer.writeheader()
-                writer.writerows(self.metrics_history)
+                writer = csv.writer(f)
+                writer.writerow(METRIC_FIELDS)
+                writer.writerows(zip(*columns))
             filepaths["csv"] = str(csv_file)
 
         return filepaths
 
     def _analyze_metrics(self) -> Dict:
         """Analyze collected metrics history."""
-        if not self.metrics_history:
+        if not self._metrics_n:
             return {}
 
-        temps = [m['temperature'] for m in self.metrics_history]
-        power = [m['power_usage'] for m in self.metrics_history]
-        util = [m['utilization'] for m in self.metrics_history]
+        def summarize(values: np.ndarray) -> Dict:
+            return {
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "avg": float(values.mean()),
+                "std": float(values.std())
+            }
 
         return {
-            "temperature": {
-                "min": min(temps),
-                "max": max(temps),
-                "avg": np.mean(temps),
-                "std": np.std(temps)
-            },
-            "power_usage": {
-                "min": min(power),
-                "max": max(power),
-                "avg": np.mean(power),
-                "std": np.std(power)
-            },
-            "utilization": {
-                "min": min(util),
-                "max": max(util),
-                "avg": np.mean(util),
-                "std": np.std(util)
-            },
-            "total_samples": len(self.metrics_history)
+            "temperature": summarize(self._metric('temperature')),
+            "power_usage": summarize(self._metric('power_usage')),
+            "utilization": summarize(self._metric('utilization')),
+            "total_samples": self._metrics_n
         }
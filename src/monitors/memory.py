@@ -3,6 +3,22 @@ import psutil
 from typing import Dict
 from datetime import datetime
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+_VIRTUAL_FIELDS = (
+    'total', 'available', 'used', 'free', 'percent',
+    'active', 'inactive', 'buffers', 'cached', 'shared'
+)
+
+
+def _format_bytes(bytes_value):
+    """Convert bytes to human readable format."""
+    if bytes_value is None:
+        return None
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit = min(len(_UNITS) - 1, max(0, (int(bytes_value).bit_length() - 1) // 10))
+    return f"{bytes_value / (1 << (10 * unit)):.2f} {_UNITS[unit]}"
+
 
 class MemoryMonitor:
     """Monitor RAM and Swap memory usage."""
@@ -14,31 +30,14 @@ class MemoryMonitor:
         Returns:
             Dictionary containing memory statistics
         """
-        virtual_mem = psutil.virtual_memory()
+        virtual_mem = psutil.virtual_memory()._asdict()
         swap_mem = psutil.swap_memory()
 
         return {
             "timestamp": datetime.now().isoformat(),
-            "virtual": {
-                "total": virtual_mem.total,
-                "available": virtual_mem.available,
-                "used": virtual_mem.used,
-                "free": virtual_mem.free,
-                "percent": virtual_mem.percent,
-                "active": getattr(virtual_mem, 'active', None),
-                "inactive": getattr(virtual_mem, 'inactive', None),
-                "buffers": getattr(virtual_mem, 'buffers', None),
-                "cached": getattr(virtual_mem, 'cached', None),
-                "shared": getattr(virtual_mem, 'shared', None)
-            },
-            "swap": {
-                "total": swap_mem.total,
-                "used": swap_mem.used,
-                "free": swap_mem.free,
-                "percent": swap_mem.percent,
-                "sin": swap_mem.sin,
-                "sout": swap_mem.sout
-            }
+            # Platform-specific fields psutil does not report come back as None
+            "virtual": {field: virtual_mem.get(field) for field in _VIRTUAL_FIELDS},
+            "swap": swap_mem._asdict()
         }
 
     def get_readable_memory(self) -> Dict:
@@ -50,29 +49,19 @@ class MemoryMonitor:
         """
         mem = self.get_memory()
 
-        def format_bytes(bytes_value):
-            """Convert bytes to human readable format."""
-            if bytes_value is None:
-                return None
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_value < 1024.0:
-                    return f"{bytes_value:.2f} {unit}"
-                bytes_value /= 1024.0
-            return f"{bytes_value:.2f} PB"
-
         return {
             "timestamp": mem["timestamp"],
             "virtual": {
-                "total": format_bytes(mem["virtual"]["total"]),
-                "available": format_bytes(mem["virtual"]["available"]),
-                "used": format_bytes(mem["virtual"]["used"]),
-                "free": format_bytes(mem["virtual"]["free"]),
+                "total": _format_bytes(mem["virtual"]["total"]),
+                "available": _format_bytes(mem["virtual"]["available"]),
+                "used": _format_bytes(mem["virtual"]["used"]),
+                "free": _format_bytes(mem["virtual"]["free"]),
                 "percent": f"{mem['virtual']['percent']:.1f}%"
             },
             "swap": {
-                "total": format_bytes(mem["swap"]["total"]),
-                "used": format_bytes(mem["swap"]["used"]),
-                "free": format_bytes(mem["swap"]["free"]),
+                "total": _format_bytes(mem["swap"]["total"]),
+                "used": _format_bytes(mem["swap"]["used"]),
+                "free": _format_bytes(mem["swap"]["free"]),
                 "percent": f"{mem['swap']['percent']:.1f}%"
             }
         }
@@ -1,16 +1,328 @@
 """Network monitoring module."""
+import os
 import psutil
+import socket
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
-from datetime import datetime
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+_COUNTER_FIELDS = (
+    "bytes_sent", "bytes_recv", "packets_sent", "packets_recv",
+    "errin", "errout", "dropin", "dropout"
+)
+_MIB = 1024 * 1024
+
+# Enum member -> name; str() on these IntEnums is slow and, since Python
+# 3.11, yields the bare number
+_FAMILY_NAMES = {family: family.name for family in socket.AddressFamily}
+_TYPE_NAMES = {sock_type: sock_type.name for sock_type in socket.SocketKind}
+_DUPLEX_NAMES = {
+    psutil.NIC_DUPLEX_FULL: "NIC_DUPLEX_FULL",
+    psutil.NIC_DUPLEX_HALF: "NIC_DUPLEX_HALF",
+    psutil.NIC_DUPLEX_UNKNOWN: "NIC_DUPLEX_UNKNOWN",
+}
+
+# (whole second, formatted local time) of the last _iso_now() call
+_ts_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Get the current local time in ISO 8601 format with microseconds.
+
+    The date/time part is only re-formatted when the second changes; within
+    a second only the microsecond suffix is appended.
+
+    Returns:
+        Timestamp string equivalent to datetime.now().isoformat()
+    """
+    global _ts_cache
+    now_us = time.time_ns() // 1000
+    sec, us = divmod(now_us, 1_000_000)
+    cached_sec, cached = _ts_cache
+    if sec != cached_sec:
+        cached = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, cached)
+    return f"{cached}.{us:06d}"
+
+
+_PROC_NET_DEV = "/proc/net/dev"
+_HAVE_PROC_NET_DEV = sys.platform.startswith("linux") and os.path.exists(_PROC_NET_DEV)
+
+# Same field order as psutil's snetio, so both feed the same formatters
+_NetIO = namedtuple("snetio", _COUNTER_FIELDS)
+
+
+def _read_net_io() -> Dict:
+    """
+    Read per-interface I/O counters.
+
+    On Linux, /proc/net/dev is parsed directly as bytes, skipping psutil's
+    per-call wrapper work. Elsewhere (or if the file cannot be read) this
+    falls back to psutil.
+
+    Returns:
+        Mapping of interface name to an snetio-compatible namedtuple
+    """
+    if _HAVE_PROC_NET_DEV:
+        try:
+            with open(_PROC_NET_DEV, "rb") as f:
+                buf = f.read()
+        except OSError:
+            buf = None
+        if buf is not None:
+            counters = {}
+            # Two header lines, then "iface: 8 receive columns 8 transmit columns"
+            for line in buf.splitlines()[2:]:
+                iface, _, rest = line.partition(b":")
+                cols = rest.split()
+                counters[iface.strip().decode("ascii", "replace")] = _NetIO(
+                    int(cols[8]), int(cols[0]), int(cols[9]), int(cols[1]),
+                    int(cols[2]), int(cols[10]), int(cols[3]), int(cols[11])
+                )
+            return counters
+    return psutil.net_io_counters(pernic=True)
+
+
+@dataclass(frozen=True)
+class IfaceIO:
+    """Per-interface I/O counters."""
+    __slots__ = _COUNTER_FIELDS
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+    errin: int
+    errout: int
+    dropin: int
+    dropout: int
+
+
+@dataclass(frozen=True)
+class IfaceAddr:
+    """One address assigned to an interface."""
+    __slots__ = ("family", "address", "netmask", "broadcast")
+    family: str
+    address: str
+    netmask: Optional[str]
+    broadcast: Optional[str]
+
+
+@dataclass(frozen=True)
+class IfaceStats:
+    """Link state of an interface."""
+    __slots__ = ("is_up", "duplex", "speed", "mtu")
+    is_up: bool
+    duplex: str
+    speed: int
+    mtu: int
+
+
+@dataclass(frozen=True)
+class IfaceInfo:
+    """Addresses and link state of an interface."""
+    __slots__ = ("addresses", "stats")
+    addresses: Tuple[IfaceAddr, ...]
+    stats: Optional[IfaceStats]
+
+
+def _counter_dict(stats) -> Dict:
+    """Convert a psutil snetio tuple into the counter dict used by the API."""
+    return {field: getattr(stats, field) for field in _COUNTER_FIELDS}
+
+
+def _speed_dict(sent_speed: float, recv_speed: float) -> Dict:
+    """Build the speed dict reported for one interface or the total."""
+    return {
+        "upload_speed_bps": sent_speed,
+        "download_speed_bps": recv_speed,
+        "upload_speed_mbps": sent_speed / _MIB,
+        "download_speed_mbps": recv_speed / _MIB
+    }
+
+
+def _byte_rates(before: Dict, after: Dict, elapsed: float) -> Dict[str, Tuple[float, float]]:
+    """Per-interface (sent, recv) bytes per second between two counter reads."""
+    rates = {}
+    for interface, stats in after.items():
+        prior = before.get(interface)
+        if prior is not None:
+            rates[interface] = (
+                (stats.bytes_sent - prior.bytes_sent) / elapsed,
+                (stats.bytes_recv - prior.bytes_recv) / elapsed
+            )
+    return rates
+
+
+class _Sample(NamedTuple):
+    """One counter read taken by the sampler."""
+    timestamp: str
+    monotonic: float
+    counters: Dict
+    elapsed: float
+    speeds: Optional[Dict[str, Tuple[float, float]]]
+
+
+class _Sampler(threading.Thread):
+    """
+    Background thread that reads the per-interface counters once per tick.
+
+    The last `history` samples are kept in a ring buffer, each with its
+    counters, the byte rates against the previous tick and a pre-formatted
+    timestamp. A rate over any interval is the difference of two buffered
+    samples, so readers never sleep or poll psutil. The thread exits on its
+    own once nobody has asked for a window for `idle_timeout` seconds.
+    """
+
+    # Fraction of the requested interval two samples must span; absorbs
+    # scheduling jitter on the tick.
+    SPAN_TOLERANCE = 0.9
+    # Shortest tick, so a zero or tiny interval cannot turn the thread into
+    # a busy loop over /proc/net/dev
+    MIN_PERIOD = 0.05
+    # Seconds without a short-interval caller before the tick reverts to
+    # the base period
+    SHORT_PERIOD_HOLD = 5.0
+
+    def __init__(self, period: float, history: int = 120, idle_timeout: float = 30.0):
+        super().__init__(name="network-sampler", daemon=True)
+        self.base_period = max(period, self.MIN_PERIOD)
+        self.period = self.base_period
+        self.idle_timeout = idle_timeout
+        self._samples: Deque[_Sample] = deque(maxlen=history)
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._stopped = False
+        self._last_used = time.monotonic()
+        self._short_used = self._last_used
+
+    def request_period(self, period: float):
+        """
+        Shorten the tick for a caller that needs finer samples.
+
+        The tick never drops below MIN_PERIOD, and it returns to the base
+        period once no caller has asked for a shorter one for
+        SHORT_PERIOD_HOLD seconds.
+
+        Args:
+            period: Tick length the caller needs, in seconds
+        """
+        period = max(period, self.MIN_PERIOD)
+        with self._cond:
+            if period <= self.period:
+                self.period = period
+                self._short_used = time.monotonic()
+
+    def stop(self):
+        """Ask the thread to exit; the current wait returns immediately."""
+        self._stop_event.set()
+
+    def latest(self, fresh: bool = False) -> Optional[_Sample]:
+        """
+        Get the latest sample.
+
+        Args:
+            fresh: If True, return None when the sample is older than one tick
+
+        Returns:
+            Latest sample, or None if there is none (or it is stale)
+        """
+        with self._cond:
+            if not self._samples:
+                return None
+            sample = self._samples[-1]
+            if fresh and time.monotonic() - sample.monotonic > self.period:
+                return None
+            return sample
+
+    def window(self, interval: float) -> Optional[Tuple[_Sample, _Sample, bool]]:
+        """
+        Get the newest sample and the latest one at least `interval` before it.
+
+        Blocks only until the buffer spans `interval` (or is full).
+
+        Args:
+            interval: Requested measurement interval in seconds
+
+        Returns:
+            (older, newest, adjacent) where adjacent means older directly
+            precedes newest, or None if the sampler stopped while waiting
+        """
+        span = interval * self.SPAN_TOLERANCE
+        with self._cond:
+            self._last_used = time.monotonic()
+            samples = self._samples
+            while not self._stopped:
+                if len(samples) >= 2 and (
+                    samples[-1].monotonic - samples[0].monotonic >= span
+                    or len(samples) == samples.maxlen
+                ):
+                    break
+                self._cond.wait()
+            if self._stopped:
+                return None
+
+            newest = samples[-1]
+            for back in range(2, len(samples) + 1):
+                older = samples[-back]
+                if newest.monotonic - older.monotonic >= span:
+                    return older, newest, back == 2
+            return samples[0], newest, len(samples) == 2
+
+    def _read(self, previous: Optional[_Sample]) -> _Sample:
+        counters = _read_net_io()
+        now = time.monotonic()
+        timestamp = _iso_now()
+        if previous is None:
+            return _Sample(timestamp, now, counters, 0.0, None)
+        elapsed = now - previous.monotonic
+        return _Sample(timestamp, now, counters, elapsed,
+                       _byte_rates(previous.counters, counters, elapsed))
+
+    def run(self):
+        sample = None
+        try:
+            while True:
+                sample = self._read(sample)
+                with self._cond:
+                    self._samples.append(sample)
+                    self._cond.notify_all()
+                    now = time.monotonic()
+                    if now - self._last_used > self.idle_timeout:
+                        break
+                    if now - self._short_used > self.SHORT_PERIOD_HOLD:
+                        self.period = self.base_period
+                    period = self.period
+                if self._stop_event.wait(period):
+                    break
+        finally:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify_all()
 
 
 class NetworkMonitor:
     """Monitor network usage and statistics."""
 
-    def __init__(self):
+    def __init__(self, connections_ttl: float = 2.0, sample_period: float = 1.0):
+        """
+        Initialize the network monitor.
+
+        Args:
+            connections_ttl: Seconds a get_connections result is reused for
+            sample_period: Longest tick of the background speed sampler
+        """
         self.last_stats = None
         self.last_time = None
+        self.connections_ttl = connections_ttl
+        self.sample_period = sample_period
+        # (monotonic time, kind, connections) of the last connection scan
+        self._conn_cache: Tuple[float, Optional[str], List[Dict]] = (0.0, None, [])
+        self._sampler: Optional["_Sampler"] = None
+        self._sampler_lock = threading.Lock()
 
     def get_interfaces(self) -> List[str]:
         """
@@ -19,58 +331,74 @@ class NetworkMonitor:
         Returns:
             List of interface names
         """
-        return list(psutil.net_io_counters(pernic=True).keys())
+        return list(_read_net_io().keys())
 
-    def get_io_counters(self, per_nic: bool = False) -> Dict:
+    def get_io_counters(self, per_nic: bool = False, as_records: bool = False) -> Dict:
         """
         Get network I/O statistics.
 
+        When the speed sampler is running and its latest sample is fresh,
+        the cached counters are served instead of polling psutil again.
+
         Args:
             per_nic: If True, return per-interface statistics
+            as_records: If True, per-interface statistics are IfaceIO records
+                instead of dicts (converted by the exporters when serialized)
 
         Returns:
             Dictionary containing network I/O statistics
         """
-        if per_nic:
-            counters = psutil.net_io_counters(pernic=True)
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "interfaces": {}
-            }
-
-            for interface, stats in counters.items():
-                result["interfaces"][interface] = {
-                    "bytes_sent": stats.bytes_sent,
-                    "bytes_recv": stats.bytes_recv,
-                    "packets_sent": stats.packets_sent,
-                    "packets_recv": stats.packets_recv,
-                    "errin": stats.errin,
-                    "errout": stats.errout,
-                    "dropin": stats.dropin,
-                    "dropout": stats.dropout
-                }
-
-            return result
+        sample = self._sampler.latest(fresh=True) if self._sampler else None
+        if sample is not None:
+            timestamp, counters = sample.timestamp, sample.counters
         else:
-            stats = psutil.net_io_counters()
+            timestamp, counters = _iso_now(), _read_net_io()
+
+        if per_nic:
+            # snetio fields are in IfaceIO field order
+            to_entry = (lambda stats: IfaceIO(*stats)) if as_records else _counter_dict
             return {
-                "timestamp": datetime.now().isoformat(),
-                "total": {
-                    "bytes_sent": stats.bytes_sent,
-                    "bytes_recv": stats.bytes_recv,
-                    "packets_sent": stats.packets_sent,
-                    "packets_recv": stats.packets_recv,
-                    "errin": stats.errin,
-                    "errout": stats.errout,
-                    "dropin": stats.dropin,
-                    "dropout": stats.dropout
+                "timestamp": timestamp,
+                "interfaces": {
+                    interface: to_entry(stats)
+                    for interface, stats in counters.items()
                 }
             }
 
+        # psutil's system-wide counters are the sum over all interfaces, so
+        # derive them from the same per-interface read.
+        total = dict.fromkeys(_COUNTER_FIELDS, 0)
+        for stats in counters.values():
+            for field in _COUNTER_FIELDS:
+                total[field] += getattr(stats, field)
+        return {
+            "timestamp": timestamp,
+            "total": total
+        }
+
+    def get_raw_io_counters(self) -> Dict:
+        """
+        Get per-interface I/O counters as psutil tuples.
+
+        Unlike get_io_counters, no per-interface dicts are built, which keeps
+        allocation flat for callers that poll frequently (e.g. the Prometheus
+        exporter).
+
+        Returns:
+            Mapping of interface name to an snetio-compatible namedtuple
+        """
+        return _read_net_io()
+
     def get_speed(self, interval: float = 1.0, per_nic: bool = False) -> Dict:
         """
         Get network speed (bytes per second).
 
+        Speeds come from a background sampler that keeps a short history of
+        counter reads; the rate is taken between the newest read and the one
+        `interval` seconds before it. Only a call that finds no sampler, or
+        not enough history yet, waits. The sampler stops itself after a
+        period without callers and is restarted on demand.
+
         Args:
             interval: Time interval for measurement in seconds
             per_nic: If True, return per-interface speeds
@@ -78,81 +406,101 @@ class NetworkMonitor:
         Returns:
             Dictionary containing network speeds
         """
-        counters_before = psutil.net_io_counters(pernic=per_nic)
-        time.sleep(interval)
-        counters_after = psutil.net_io_counters(pernic=per_nic)
-
-        if per_nic:
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "interval_seconds": interval,
-                "interfaces": {}
-            }
+        while True:
+            with self._sampler_lock:
+                sampler = self._sampler
+                if sampler is None or not sampler.is_alive():
+                    sampler = _Sampler(self.sample_period)
+                    sampler.request_period(interval)
+                    sampler.start()
+                    self._sampler = sampler
+                elif interval < sampler.base_period:
+                    sampler.request_period(interval)
+            window = sampler.window(interval)
+            if window is not None:
+                break
 
-            for interface in counters_before.keys():
-                if interface in counters_after:
-                    sent_speed = (counters_after[interface].bytes_sent -
-                                 counters_before[interface].bytes_sent) / interval
-                    recv_speed = (counters_after[interface].bytes_recv -
-                                 counters_before[interface].bytes_recv) / interval
-
-                    result["interfaces"][interface] = {
-                        "upload_speed_bps": sent_speed,
-                        "download_speed_bps": recv_speed,
-                        "upload_speed_mbps": sent_speed / (1024 * 1024),
-                        "download_speed_mbps": recv_speed / (1024 * 1024)
-                    }
-
-            return result
+        older, newest, adjacent = window
+        elapsed = newest.monotonic - older.monotonic
+        if adjacent:
+            speeds = newest.speeds
         else:
-            sent_speed = (counters_after.bytes_sent - counters_before.bytes_sent) / interval
-            recv_speed = (counters_after.bytes_recv - counters_before.bytes_recv) / interval
+            speeds = _byte_rates(older.counters, newest.counters, elapsed)
 
+        if per_nic:
             return {
-                "timestamp": datetime.now().isoformat(),
-                "interval_seconds": interval,
-                "total": {
-                    "upload_speed_bps": sent_speed,
-                    "download_speed_bps": recv_speed,
-                    "upload_speed_mbps": sent_speed / (1024 * 1024),
-                    "download_speed_mbps": recv_speed / (1024 * 1024)
+                "timestamp": newest.timestamp,
+                "interval_seconds": elapsed,
+                "interfaces": {
+                    interface: _speed_dict(sent, recv)
+                    for interface, (sent, recv) in speeds.items()
                 }
             }
 
+        sent_total = sum(sent for sent, _ in speeds.values())
+        recv_total = sum(recv for _, recv in speeds.values())
+        return {
+            "timestamp": newest.timestamp,
+            "interval_seconds": elapsed,
+            "total": _speed_dict(sent_total, recv_total)
+        }
+
+    def stop(self):
+        """Stop the background speed sampler, if one is running."""
+        with self._sampler_lock:
+            if self._sampler is not None:
+                self._sampler.stop()
+                self._sampler = None
+
     def get_connections(self, kind: str = "inet") -> List[Dict]:
         """
         Get active network connections.
 
+        psutil.net_connections walks every /proc/net table and process fd
+        list, so a result is reused for connections_ttl seconds per kind.
+
         Args:
             kind: Connection type ('inet', 'inet4', 'inet6', 'tcp', 'udp', 'unix', 'all')
 
         Returns:
             List of active connections
         """
+        scanned_at, cached_kind, cached = self._conn_cache
+        now = time.monotonic()
+        if cached_kind == kind and now - scanned_at < self.connections_ttl:
+            return list(cached)
+
         try:
             connections = psutil.net_connections(kind=kind)
-            result = []
-
-            for conn in connections:
-                conn_info = {
-                    "fd": conn.fd,
-                    "family": str(conn.family),
-                    "type": str(conn.type),
-                    "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
-                    "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
-                    "status": conn.status,
-                    "pid": conn.pid
-                }
-                result.append(conn_info)
-
-            return result
         except (psutil.AccessDenied, PermissionError):
             return []
 
-    def get_interface_addresses(self) -> Dict:
+        family_names = _FAMILY_NAMES
+        type_names = _TYPE_NAMES
+        result = [
+            {
+                "fd": conn.fd,
+                "family": family_names.get(conn.family) or str(conn.family),
+                "type": type_names.get(conn.type) or str(conn.type),
+                "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
+                "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
+                "status": conn.status,
+                "pid": conn.pid
+            }
+            for conn in connections
+        ]
+
+        self._conn_cache = (now, kind, result)
+        return list(result)
+
+    def get_interface_addresses(self, as_records: bool = False) -> Dict:
         """
         Get network interface addresses.
 
+        Args:
+            as_records: If True, each interface is an IfaceInfo record instead
+                of a nested dict (converted by the exporters when serialized)
+
         Returns:
             Dictionary containing interface addresses
         """
@@ -160,32 +508,57 @@ class NetworkMonitor:
         stats = psutil.net_if_stats()
 
         result = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "interfaces": {}
         }
 
+        family_names = _FAMILY_NAMES
+        duplex_names = _DUPLEX_NAMES
+        interfaces = result["interfaces"]
+
+        if as_records:
+            for interface, addr_list in addrs.items():
+                stat = stats.get(interface)
+                interfaces[interface] = IfaceInfo(
+                    tuple(
+                        IfaceAddr(
+                            family_names.get(addr.family) or str(addr.family),
+                            addr.address,
+                            addr.netmask,
+                            addr.broadcast
+                        )
+                        for addr in addr_list
+                    ),
+                    IfaceStats(
+                        stat.isup,
+                        duplex_names.get(stat.duplex) or str(stat.duplex),
+                        stat.speed,
+                        stat.mtu
+                    ) if stat is not None else None
+                )
+            return result
+
         for interface, addr_list in addrs.items():
-            result["interfaces"][interface] = {
-                "addresses": [],
+            entry = interfaces[interface] = {
+                "addresses": [
+                    {
+                        "family": family_names.get(addr.family) or str(addr.family),
+                        "address": addr.address,
+                        "netmask": addr.netmask,
+                        "broadcast": addr.broadcast
+                    }
+                    for addr in addr_list
+                ],
                 "stats": {}
             }
 
-            for addr in addr_list:
-                addr_info = {
-                    "family": str(addr.family),
-                    "address": addr.address,
-                    "netmask": addr.netmask,
-                    "broadcast": addr.broadcast
-                }
-                result["interfaces"][interface]["addresses"].append(addr_info)
-
-            if interface in stats:
-                stat = stats[interface]
-                result["interfaces"][interface]["stats"] = {
+            stat = stats.get(interface)
+            if stat is not None:
+                entry["stats"] = {
                     "is_up": stat.isup,
-                    "duplex": str(stat.duplex),
+                    "duplex": duplex_names.get(stat.duplex) or str(stat.duplex),
                     "speed": stat.speed,
                     "mtu": stat.mtu
                 }
 
-        return result
\ No newline at end of file
+        return result
@@ -1,17 +1,330 @@
 """Internet speed test monitoring module."""
+import asyncio
+import json
+import os
 import speedtest
-from typing import Dict, Optional
+import statistics
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 
 class SpeedTestMonitor:
     """Monitor internet connection speed."""
 
+    # Seconds a downloaded speedtest.net configuration / server list is reused
+    CONFIG_TTL = 3600.0
+    # Number of nearest servers pinged when no server is requested
+    CLOSEST_SERVERS = 5
+    # Seconds the automatically selected best server is reused across runs
+    SERVER_TTL = 6 * 3600.0
+    # Where the selected server is persisted between processes
+    SERVER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'systemmonitor', 'speedtest_server.json')
+    # TCP connects timed per server when measuring latency
+    PING_COUNT = 3
+    # Seconds before a latency probe connect is abandoned
+    PING_TIMEOUT = 2.0
+    # Concurrent HTTP connections used by the aiohttp download/upload tests
+    STREAMS = 8
+    # Bytes read per chunk while streaming a download
+    CHUNK_SIZE = 64 * 1024
+    # Size of the shared upload body; covers speedtest.net's largest upload size (7 MiB)
+    UPLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
     def __init__(self):
         """Initialize the speed test monitor."""
         self.last_test = None
         self.test_lock = threading.Lock()
+        # Guards the cached client and server list; not held during a test
+        self._cache_lock = threading.RLock()
+        self._st = None
+        self._st_ts = 0.0
+        self._servers = None
+        self._servers_ts = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speedtest")
+        self._upload_buf = None
+
+    def _speedtest(self) -> "speedtest.Speedtest":
+        """
+        Get the cached Speedtest client, rebuilding it once CONFIG_TTL expires.
+
+        Constructing a Speedtest downloads and parses the speedtest.net
+        configuration, so it is only done once per TTL.
+
+        Returns:
+            Configured Speedtest instance
+        """
+        with self._cache_lock:
+            if self._st is None or time.monotonic() - self._st_ts > self.CONFIG_TTL:
+                self._st = speedtest.Speedtest()
+                self._st_ts = time.monotonic()
+                self._servers = None
+            return self._st
+
+    def _server_list(self) -> Dict:
+        """
+        Get the cached server list (distance -> servers), refreshing it on expiry.
+
+        Returns:
+            Mapping of distance to the servers at that distance
+        """
+        with self._cache_lock:
+            st = self._speedtest()
+            if self._servers is None or time.monotonic() - self._servers_ts > self.CONFIG_TTL:
+                # Copy: later filtered get_servers() calls clear st.servers in place
+                self._servers = dict(st.get_servers())
+                self._servers_ts = time.monotonic()
+            return self._servers
+
+    def _candidate_servers(self, server_id: Optional[int]) -> List[Dict]:
+        """
+        Get the servers to ping when picking the test server.
+
+        Args:
+            server_id: Optional specific server ID to test against
+
+        Returns:
+            List of speedtest server dicts
+        """
+        servers = self._server_list()
+        if server_id is None:
+            closest = []
+            for distance in sorted(servers):
+                closest.extend(servers[distance])
+                if len(closest) >= self.CLOSEST_SERVERS:
+                    break
+            return closest[:self.CLOSEST_SERVERS]
+
+        matches = [
+            server
+            for server_list in servers.values()
+            for server in server_list
+            if int(server['id']) == server_id
+        ]
+        if not matches:
+            # Not among the nearby servers; ask speedtest.net for it directly
+            with self._cache_lock:
+                matches = [
+                    server
+                    for server_list in self._speedtest().get_servers(servers=[server_id]).values()
+                    for server in server_list
+                ]
+        return matches
+
+    def _cached_server(self) -> Optional[Dict]:
+        """
+        Load the persisted best server if it was selected within SERVER_TTL.
+
+        Returns:
+            Speedtest server dict, or None if missing, stale or unreadable
+        """
+        try:
+            if time.time() - os.path.getmtime(self.SERVER_CACHE) > self.SERVER_TTL:
+                return None
+            with open(self.SERVER_CACHE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_server(self, server: Dict):
+        """
+        Persist the selected best server so later runs can skip probing.
+
+        Args:
+            server: Selected speedtest server dict
+        """
+        try:
+            os.makedirs(os.path.dirname(self.SERVER_CACHE), exist_ok=True)
+            tmp = f"{self.SERVER_CACHE}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump({k: v for k, v in server.items() if k != 'latency'}, f)
+            os.replace(tmp, self.SERVER_CACHE)
+        except OSError:
+            pass
+
+    async def _ping(self, server: Dict) -> Optional[float]:
+        """
+        Measure latency to a server as the median of PING_COUNT TCP connects.
+
+        Args:
+            server: Speedtest server dict ('host' is "hostname:port")
+
+        Returns:
+            Median connect time in milliseconds, or None if no connect succeeded
+        """
+        host, sep, port = server['host'].rpartition(':')
+        if not sep:
+            host, port = port, '80'
+
+        times = []
+        for _ in range(self.PING_COUNT):
+            start = time.perf_counter()
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), self.PING_TIMEOUT)
+            except (OSError, ValueError, asyncio.TimeoutError):
+                continue
+            times.append((time.perf_counter() - start) * 1000.0)
+            writer.close()
+            await writer.wait_closed()
+        return statistics.median(times) if times else None
+
+    def _lowest_latency(self, servers: List[Dict]) -> Dict:
+        """
+        Ping all servers concurrently and pick the one with the lowest latency.
+
+        Args:
+            servers: Candidate speedtest server dicts
+
+        Returns:
+            Copy of the fastest server dict with 'latency' set
+        """
+        async def ping_all():
+            return await asyncio.gather(*(self._ping(server) for server in servers))
+
+        latencies = asyncio.run(ping_all())
+        reachable = [(latency, server) for latency, server in zip(latencies, servers) if latency is not None]
+        if not reachable:
+            raise speedtest.SpeedtestBestServerFailure('Unable to connect to servers to test latency.')
+        latency, server = min(reachable, key=lambda pair: pair[0])
+        return dict(server, latency=latency)
+
+    def _best_server(self, server_id: Optional[int]) -> Dict:
+        """
+        Select the test server, reusing the persisted choice when no server is requested.
+
+        The cached server is still pinged for a fresh latency; only if it
+        fails to answer are the nearest candidates probed again.
+
+        Args:
+            server_id: Optional specific server ID to test against
+
+        Returns:
+            Selected server dict (with 'latency')
+        """
+        if server_id is None:
+            cached = self._cached_server()
+            if cached:
+                try:
+                    return self._lowest_latency([cached])
+                except speedtest.SpeedtestBestServerFailure:
+                    pass
+
+        best = self._lowest_latency(self._candidate_servers(server_id))
+        if server_id is None:
+            self._save_server(best)
+        return best
+
+    async def _transfer(self, jobs: List[Tuple[str, Optional[bytes]]], seconds: float) -> float:
+        """
+        Run HTTP transfers over STREAMS concurrent connections.
+
+        A single stream cannot fill the bandwidth-delay product of a fast
+        link, so each connection keeps pulling the next job until the queue
+        is empty or the time limit passes.
+
+        Args:
+            jobs: (url, body) pairs; a None body is a download (GET), otherwise
+                the body is uploaded (POST)
+            seconds: Time limit after which no new transfers are started
+
+        Returns:
+            Throughput in bits per second
+        """
+        loop = asyncio.get_running_loop()
+        queue = deque(jobs)
+        total = 0
+
+        async def worker(session):
+            nonlocal total
+            while queue and loop.time() < deadline:
+                url, body = queue.popleft()
+                try:
+                    if body is None:
+                        async with session.get(url) as response:
+                            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                                total += len(chunk)
+                    else:
+                        async with session.post(url, data=body) as response:
+                            await response.read()
+                        total += len(body)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    continue
+
+        timeout = aiohttp.ClientTimeout(total=seconds * 2)
+        connector = aiohttp.TCPConnector(limit=self.STREAMS)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                         headers={'User-Agent': speedtest.build_user_agent()}) as session:
+            start = loop.time()
+            deadline = start + seconds
+            await asyncio.gather(*(worker(session) for _ in range(self.STREAMS)))
+            elapsed = loop.time() - start
+
+        return total * 8 / elapsed if elapsed > 0 else 0.0
+
+    def _measure(self, st: "speedtest.Speedtest", best: Dict) -> Tuple[float, float]:
+        """
+        Measure download and upload throughput against the selected server.
+
+        Uses concurrent aiohttp transfers when aiohttp is installed, sized from
+        the speedtest.net configuration like speedtest-cli's own test, and
+        falls back to speedtest-cli's threaded download()/upload() otherwise.
+
+        Args:
+            st: Speedtest client (configuration source)
+            best: Selected server dict
+
+        Returns:
+            Tuple of (download, upload) in bits per second
+        """
+        if aiohttp is None:
+            # speedtest-cli transfers against its own selected server
+            st.get_best_server([best])
+            return st.download(), st.upload()
+
+        config = st.config
+        base = os.path.dirname(best['url'])
+        stamp = int(time.time() * 1000)
+        downloads = [
+            (f"{base}/random{size}x{size}.jpg?x={stamp}.{i}", None)
+            for size in config['sizes']['download']
+            for i in range(config['counts']['download'])
+        ]
+        # One random buffer generated on first use; every upload body is a
+        # zero-copy slice of it
+        if self._upload_buf is None:
+            self._upload_buf = memoryview(b'content1=' + os.urandom(self.UPLOAD_BUFFER_SIZE - 9))
+        uploads = [
+            (f"{best['url']}?x={stamp}.{i}", self._upload_buf[:size])
+            for i in range(config['counts']['upload'])
+            for size in config['sizes']['upload']
+        ]
+
+        download = asyncio.run(self._transfer(downloads, config['length']['download']))
+        upload = asyncio.run(self._transfer(uploads, config['length']['upload']))
+        return download, upload
+
+    def start_speedtest(self, server_id: Optional[int] = None) -> Future:
+        """
+        Start an internet speed test in the background.
+
+        Tests run one at a time on a dedicated worker thread, so callers can
+        poll or await the returned future instead of blocking.
+
+        Args:
+            server_id: Optional specific server ID to test against
+
+        Returns:
+            Future resolving to the run_speedtest result dictionary
+        """
+        return self._executor.submit(self.run_speedtest, server_id)
 
     def run_speedtest(self, server_id: Optional[int] = None) -> Dict:
         """
@@ -25,17 +338,14 @@ class SpeedTestMonitor:
         """
         with self.test_lock:
             try:
-                st = speedtest.Speedtest()
-
-                # Get server list and select best server
-                st.get_servers(servers=[server_id] if server_id else [])
-                best = st.get_best_server()
+                st = self._speedtest()
 
-                # Run download test
-                download_speed = st.download()
+                # Select the best of the candidate servers
+                best = self._best_server(server_id)
+                client = st.config['client']
 
-                # Run upload test
-                upload_speed = st.upload()
+                # Run download and upload tests
+                download_speed, upload_speed = self._measure(st, best)
 
                 # Get ping
                 ping = best['latency']
@@ -66,9 +376,9 @@ class SpeedTestMonitor:
                         "distance": best['d']
                     },
                     "client": {
-                        "ip": st.results.client['ip'],
-                        "isp": st.results.client['isp'],
-                        "country": st.results.client['country']
+                        "ip": client['ip'],
+                        "isp": client['isp'],
+                        "country": client['country']
                     }
                 }
 
@@ -113,11 +423,10 @@ class SpeedTestMonitor:
             Dictionary containing available servers
         """
         try:
-            st = speedtest.Speedtest()
-            st.get_servers()
+            server_map = self._server_list()
 
             servers = []
-            for server_list in list(st.servers.values())[:limit]:
+            for server_list in list(server_map.values())[:limit]:
                 for server in server_list:
                     servers.append({
                         "id": server['id'],
@@ -148,8 +457,7 @@ class SpeedTestMonitor:
             Dictionary containing client information
         """
         try:
-            st = speedtest.Speedtest()
-            config = st.get_config()
+            config = self._speedtest().config
 
             return {
                 "timestamp": datetime.now().isoformat(),
@@ -1,14 +1,195 @@
 """Historical data storage and management."""
+import atexit
 import json
+import logging
+import queue
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import threading
 
+logger = logging.getLogger(__name__)
+
+# Insert statements, prepared once and reused by the writer thread
+_INSERT_SQL = {
+    "cpu_history": """
+        INSERT INTO cpu_history
+        (timestamp, usage_percent, frequency_current, load_avg_1min, load_avg_5min, load_avg_15min)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+    "memory_history": """
+        INSERT INTO memory_history
+        (timestamp, virtual_total, virtual_used, virtual_percent, swap_total, swap_used, swap_percent)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "disk_history": """
+        INSERT INTO disk_history
+        (timestamp, mountpoint, total, used, percent, read_bytes, write_bytes)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "network_history": """
+        INSERT INTO network_history
+        (timestamp, interface, bytes_sent, bytes_recv, upload_speed, download_speed)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+    "gpu_history": """
+        INSERT INTO gpu_history
+        (timestamp, gpu_index, gpu_name, utilization_gpu, utilization_memory,
+         memory_used, memory_total, temperature, power_usage)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+}
+
+# Tables that may be named in queries built with f-strings
+HISTORY_TABLES = tuple(_INSERT_SQL)
+
+# PRAGMA user_version of the current schema; 2 dropped AUTOINCREMENT ids
+SCHEMA_VERSION = 2
+
+# Bytes of the database file each connection may memory-map
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+def to_dicts(result: Dict) -> List[Dict]:
+    """
+    Convert a columnar history result into one dict per row.
+
+    Args:
+        result: Result of HistoricalDatabase.get_history_columnar
+
+    Returns:
+        List of records keyed by column name
+    """
+    columns = result["columns"]
+    return [dict(zip(columns, row)) for row in result["rows"]]
+
+
+def _cpu_rows(data: Dict) -> List[tuple]:
+    """Build cpu_history rows from CPU monitor data."""
+    frequency = data.get("frequency")
+    load_avg = data.get("load_average")
+    return [(
+        data.get("timestamp"),
+        data.get("usage_percent"),
+        frequency.get("current") if frequency else None,
+        load_avg.get("1min") if load_avg else None,
+        load_avg.get("5min") if load_avg else None,
+        load_avg.get("15min") if load_avg else None
+    )]
+
+
+def _memory_rows(data: Dict) -> List[tuple]:
+    """Build memory_history rows from memory monitor data."""
+    virtual = data.get("virtual", {})
+    swap = data.get("swap", {})
+    return [(
+        data.get("timestamp"),
+        virtual.get("total"),
+        virtual.get("used"),
+        virtual.get("percent"),
+        swap.get("total"),
+        swap.get("used"),
+        swap.get("percent")
+    )]
+
+
+def _disk_rows(data: Dict) -> List[tuple]:
+    """Build disk_history rows (one per partition) from disk monitor data."""
+    timestamp = data.get("timestamp")
+    io_stats = data.get("io_stats", {})
+    total_io = io_stats.get("total", {}) if isinstance(io_stats, dict) else {}
+    read_bytes = total_io.get("read_bytes")
+    write_bytes = total_io.get("write_bytes")
+
+    rows = []
+    for partition in data.get("partitions", []):
+        usage = partition.get("usage", {})
+        if "error" not in usage:
+            rows.append((
+                timestamp,
+                partition.get("mountpoint"),
+                usage.get("total"),
+                usage.get("used"),
+                usage.get("percent"),
+                read_bytes,
+                write_bytes
+            ))
+    return rows
+
+
+def _network_rows(data: Dict) -> List[tuple]:
+    """Build network_history rows from network monitor data."""
+    timestamp = data.get("timestamp")
+
+    # Per-interface rows if available, otherwise a single total row
+    interfaces = data.get("interfaces") or {"total": data.get("total", {})}
+    return [
+        (
+            timestamp,
+            interface,
+            stats.get("bytes_sent"),
+            stats.get("bytes_recv"),
+            stats.get("upload_speed_bps"),
+            stats.get("download_speed_bps")
+        )
+        for interface, stats in interfaces.items()
+    ]
+
+
+def _gpu_rows(data: Dict) -> List[tuple]:
+    """Build gpu_history rows (one per GPU) from GPU monitor data."""
+    if not data.get("available"):
+        return []
+
+    timestamp = data.get("timestamp")
+    rows = []
+    for gpu in data.get("gpus", []):
+        if "error" not in gpu:
+            utilization = gpu.get("utilization", {})
+            memory = gpu.get("memory", {})
+            power = gpu.get("power", {})
+            rows.append((
+                timestamp,
+                gpu.get("index"),
+                gpu.get("name"),
+                utilization.get("gpu"),
+                utilization.get("memory"),
+                memory.get("used"),
+                memory.get("total"),
+                gpu.get("temperature"),
+                power.get("usage") if power else None
+            ))
+    return rows
+
+
+# Snapshot key -> (table, row builder)
+_ROW_BUILDERS = {
+    "cpu": ("cpu_history", _cpu_rows),
+    "memory": ("memory_history", _memory_rows),
+    "disk": ("disk_history", _disk_rows),
+    "network": ("network_history", _network_rows),
+    "gpu": ("gpu_history", _gpu_rows),
+}
+
 
 class HistoricalDatabase:
-    """Manage historical monitoring data storage."""
+    """
+    Manage historical monitoring data storage.
+
+    store_* calls only enqueue rows; a background writer thread wakes every
+    FLUSH_INTERVAL seconds (or early once WRITE_WATERMARK entries are
+    queued), drains the queue and commits each batch with one executemany
+    per table. Call flush() before reading back data that was just stored.
+    """
+
+    # Maximum number of queued store_* calls committed in one transaction
+    WRITE_BATCH = 500
+    # Seconds the writer sleeps between drains when the queue stays short
+    FLUSH_INTERVAL = 0.5
+    # Queue length at which a store_* call wakes the writer early
+    WRITE_WATERMARK = 64
 
     def __init__(self, db_path: str = "monitor_history.db"):
         """
@@ -18,19 +199,116 @@ class HistoricalDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._ro_conn: Optional[sqlite3.Connection] = None
         self._init_database()
 
+        self._write_q: "queue.Queue" = queue.Queue(maxsize=10_000)
+        self._wake = threading.Event()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="history-writer", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+
+        Connections are kept open in autocommit mode with WAL journaling, so
+        readers and a writer proceed concurrently and each write transaction
+        costs no more than an append to the WAL. Statements run through
+        Connection.execute so their compiled form is reused from the
+        connection's statement cache.
+
+        Returns:
+            SQLite connection owned by the calling thread
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False, cached_statements=256
+            )
+            # page_size only takes effect before the file's first write
+            conn.execute("PRAGMA page_size=8192")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._local.conn = conn
+            with self.lock:
+                self._connections.append(conn)
+        return conn
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Get the read-only connection shared by all reader threads.
+
+        With WAL journaling, reads on this connection never wait for the
+        writer and never block it.
+
+        Returns:
+            Read-only SQLite connection
+        """
+        conn = self._ro_conn
+        if conn is None:
+            with self.lock:
+                if self._ro_conn is None:
+                    conn = sqlite3.connect(
+                        f"file:{Path(self.db_path).resolve()}?mode=ro", uri=True,
+                        check_same_thread=False, cached_statements=256
+                    )
+                    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+                    self._ro_conn = conn
+                    self._connections.append(conn)
+                conn = self._ro_conn
+        return conn
+
+    @staticmethod
+    def _check_table(table: str):
+        """Reject table names that are not history tables."""
+        if table not in HISTORY_TABLES:
+            raise ValueError(f"Unknown history table: {table}")
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in one write transaction on this thread's connection."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self):
+        """Write out queued samples, stop the writer and close every connection."""
+        if self._writer_thread.is_alive():
+            self._write_q.put(None)
+            self._wake.set()
+            self._writer_thread.join()
+        with self.lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._ro_conn = None
+        self._local = threading.local()
+
     def _init_database(self):
         """Initialize database tables."""
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        with self.lock, self._transaction() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            legacy = self._autoincrement_tables(conn) if version < SCHEMA_VERSION else []
+            for table in legacy:
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_v1")
 
             # CPU history table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS cpu_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp TEXT NOT NULL,
                     usage_percent REAL,
                     frequency_current REAL,
@@ -41,9 +319,9 @@ class HistoricalDatabase:
             """)
 
             # Memory history table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp TEXT NOT NULL,
                     virtual_total INTEGER,
                     virtual_used INTEGER,
@@ -55,9 +333,9 @@ class HistoricalDatabase:
             """)
 
             # Disk history table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS disk_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp TEXT NOT NULL,
                     mountpoint TEXT,
                     total INTEGER,
@@ -69,9 +347,9 @@ class HistoricalDatabase:
             """)
 
             # Network history table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS network_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp TEXT NOT NULL,
                     interface TEXT,
                     bytes_sent INTEGER,
@@ -82,9 +360,9 @@ class HistoricalDatabase:
             """)
 
             # GPU history table
-            cursor.execute("""
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS gpu_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp TEXT NOT NULL,
                     gpu_index INTEGER,
                     gpu_name TEXT,
@@ -97,179 +375,160 @@ class HistoricalDatabase:
                 )
             """)
 
-            # Create indexes for faster queries
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_cpu_timestamp ON cpu_history(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_memory_timestamp ON memory_history(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_disk_timestamp ON disk_history(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_network_timestamp ON network_history(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_gpu_timestamp ON gpu_history(timestamp)")
+            # Copy rows out of pre-v2 tables; dropping them also frees
+            # their index names for the indexes below
+            for table in legacy:
+                conn.execute(f"INSERT INTO {table} SELECT * FROM {table}_v1")
+                conn.execute(f"DROP TABLE {table}_v1")
+
+            # Create indexes for faster queries. Each leads with timestamp for
+            # the range scans in get_history and cleanup_old_data, and also
+            # carries the column get_statistics aggregates so MIN/MAX/AVG are
+            # answered from the index alone.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cpu_ts_usage ON cpu_history(timestamp, usage_percent)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_ts_percent ON memory_history(timestamp, virtual_percent)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_disk_ts_percent ON disk_history(timestamp, percent)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_network_ts_iface ON network_history(timestamp, interface)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_gpu_ts_util ON gpu_history(timestamp, utilization_gpu)")
+
+            # The timestamp-only indexes are prefixes of the ones above
+            for index in ("idx_cpu_timestamp", "idx_memory_timestamp", "idx_disk_timestamp",
+                          "idx_network_timestamp", "idx_gpu_timestamp"):
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+
+            # Refresh planner statistics; the limit bounds the cost on large files
+            conn.execute("PRAGMA analysis_limit=1000")
+            conn.execute("ANALYZE")
+
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @staticmethod
+    def _autoincrement_tables(conn: sqlite3.Connection) -> List[str]:
+        """
+        Find history tables still declared with AUTOINCREMENT ids.
+
+        AUTOINCREMENT makes every insert also update sqlite_sequence; a plain
+        INTEGER PRIMARY KEY (the rowid) is enough for append-only samples.
+
+        Args:
+            conn: Connection inside the schema transaction
+
+        Returns:
+            Names of tables that need rebuilding
+        """
+        return [
+            name
+            for name, sql in conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+            )
+            if name in HISTORY_TABLES and "AUTOINCREMENT" in sql.upper()
+        ]
+
+    def _enqueue(self, *batches: Tuple[str, List[tuple]]):
+        """Hand (table, rows) batches to the writer thread; no SQL runs in the caller."""
+        batches = tuple(batch for batch in batches if batch[1])
+        if batches:
+            self._write_q.put(batches)
+            if self._write_q.qsize() >= self.WRITE_WATERMARK:
+                self._wake.set()
+
+    def _drain(self) -> List:
+        """Take up to WRITE_BATCH entries off the write queue without blocking."""
+        items = []
+        while len(items) < self.WRITE_BATCH:
+            try:
+                items.append(self._write_q.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _writer_loop(self):
+        """
+        Commit queued rows on a coarse cadence.
+
+        The writer sleeps for FLUSH_INTERVAL, or until the queue crosses
+        WRITE_WATERMARK, then drains everything buffered, committing up to
+        WRITE_BATCH entries per transaction.
+        """
+        while True:
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+
+            stop = False
+            items = self._drain()
+            while items:
+                if any(entry is None for entry in items):
+                    stop = True
+
+                # Any failure drops this batch only; the writer must survive
+                # and mark every entry done, or flush() would block forever
+                try:
+                    tables: Dict[str, List[tuple]] = {}
+                    for entry in items:
+                        if entry is None:
+                            continue
+                        for table, rows in entry:
+                            tables.setdefault(table, []).extend(rows)
+
+                    if tables:
+                        with self._transaction() as conn:
+                            for table, rows in tables.items():
+                                conn.executemany(_INSERT_SQL[table], rows)
+                except Exception:
+                    logger.exception("Error writing history batch")
+                finally:
+                    for _ in items:
+                        self._write_q.task_done()
+                items = self._drain()
+
+            if stop:
+                return
+
+    def flush(self):
+        """Block until every queued sample has been written."""
+        self._wake.set()
+        self._write_q.join()
+
+    def store_snapshot(self, snapshot: Dict):
+        """
+        Store one sampling tick for every subsystem in a single queue entry.
+
+        All rows of the tick are committed in the same transaction, instead
+        of one store_* call per subsystem.
 
-            conn.commit()
-            conn.close()
+        Args:
+            snapshot: Dictionary with any of the keys "cpu", "memory", "disk",
+                "network" and "gpu", each holding that monitor's data
+        """
+        self._enqueue(*(
+            (table, build_rows(snapshot[key]))
+            for key, (table, build_rows) in _ROW_BUILDERS.items()
+            if snapshot.get(key)
+        ))
 
     def store_cpu_data(self, data: Dict):
         """Store CPU monitoring data."""
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            load_avg = data.get("load_average", {})
-            cursor.execute("""
-                INSERT INTO cpu_history
-                (timestamp, usage_percent, frequency_current, load_avg_1min, load_avg_5min, load_avg_15min)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                data.get("timestamp"),
-                data.get("usage_percent"),
-                data.get("frequency", {}).get("current") if data.get("frequency") else None,
-                load_avg.get("1min") if load_avg else None,
-                load_avg.get("5min") if load_avg else None,
-                load_avg.get("15min") if load_avg else None
-            ))
-
-            conn.commit()
-            conn.close()
+        self._enqueue(("cpu_history", _cpu_rows(data)))
 
     def store_memory_data(self, data: Dict):
         """Store memory monitoring data."""
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            virtual = data.get("virtual", {})
-            swap = data.get("swap", {})
-
-            cursor.execute("""
-                INSERT INTO memory_history
-                (timestamp, virtual_total, virtual_used, virtual_percent, swap_total, swap_used, swap_percent)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get("timestamp"),
-                virtual.get("total"),
-                virtual.get("used"),
-                virtual.get("percent"),
-                swap.get("total"),
-                swap.get("used"),
-                swap.get("percent")
-            ))
-
-            conn.commit()
-            conn.close()
+        self._enqueue(("memory_history", _memory_rows(data)))
 
     def store_disk_data(self, data: Dict):
         """Store disk monitoring data."""
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            timestamp = data.get("timestamp")
-            io_stats = data.get("io_stats", {})
-            total_io = io_stats.get("total", {}) if isinstance(io_stats, dict) else {}
-
-            # Store data for each partition
-            for partition in data.get("partitions", []):
-                usage = partition.get("usage", {})
-                if "error" not in usage:
-                    cursor.execute("""
-                        INSERT INTO disk_history
-                        (timestamp, mountpoint, total, used, percent, read_bytes, write_bytes)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        timestamp,
-                        partition.get("mountpoint"),
-                        usage.get("total"),
-                        usage.get("used"),
-                        usage.get("percent"),
-                        total_io.get("read_bytes"),
-                        total_io.get("write_bytes")
-                    ))
-
-            conn.commit()
-            conn.close()
+        self._enqueue(("disk_history", _disk_rows(data)))
 
     def store_network_data(self, data: Dict):
         """Store network monitoring data."""
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            timestamp = data.get("timestamp")
-
-            # Store per-interface data if available
-            interfaces = data.get("interfaces", {})
-            if interfaces:
-                for interface, stats in interfaces.items():
-                    cursor.execute("""
-                        INSERT INTO network_history
-                        (timestamp, interface, bytes_sent, bytes_recv, upload_speed, download_speed)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        timestamp,
-                        interface,
-                        stats.get("bytes_sent"),
-                        stats.get("bytes_recv"),
-                        stats.get("upload_speed_bps"),
-                        stats.get("download_speed_bps")
-                    ))
-            else:
-                # Store total data
-                total = data.get("total", {})
-                cursor.execute("""
-                    INSERT INTO network_history
-                    (timestamp, interface, bytes_sent, bytes_recv, upload_speed, download_speed)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    timestamp,
-                    "total",
-                    total.get("bytes_sent"),
-                    total.get("bytes_recv"),
-                    total.get("upload_speed_bps"),
-                    total.get("download_speed_bps")
-                ))
-
-            conn.commit()
-            conn.close()
+        self._enqueue(("network_history", _network_rows(data)))
 
     def store_gpu_data(self, data: Dict):
         """Store GPU monitoring data."""
-        if not data.get("available"):
-            return
+        self._enqueue(("gpu_history", _gpu_rows(data)))
 
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            timestamp = data.get("timestamp")
-
-            for gpu in data.get("gpus", []):
-                if "error" not in gpu:
-                    utilization = gpu.get("utilization", {})
-                    memory = gpu.get("memory", {})
-                    power = gpu.get("power", {})
-
-                    cursor.execute("""
-                        INSERT INTO gpu_history
-                        (timestamp, gpu_index, gpu_name, utilization_gpu, utilization_memory,
-                         memory_used, memory_total, temperature, power_usage)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        timestamp,
-                        gpu.get("index"),
-                        gpu.get("name"),
-                        utilization.get("gpu"),
-                        utilization.get("memory"),
-                        memory.get("used"),
-                        memory.get("total"),
-                        gpu.get("temperature"),
-                        power.get("usage") if power else None
-                    ))
-
-            conn.commit()
-            conn.close()
-
-    def get_history(self, table: str, hours: int = 24, limit: Optional[int] = None) -> List[Dict]:
+    def get_history_columnar(self, table: str, hours: int = 24, limit: Optional[int] = None) -> Dict:
         """
-        Retrieve historical data from a table.
+        Retrieve historical data from a table as column names plus row tuples.
 
         Args:
             table: Table name (cpu_history, memory_history, etc.)
@@ -277,46 +536,68 @@ class HistoricalDatabase:
             limit: Maximum number of records to return
 
         Returns:
-            List of historical records
+            Dictionary with "columns" (list of names) and "rows" (list of tuples)
         """
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        self._check_table(table)
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
 
-            cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        query = f"SELECT * FROM {table} WHERE timestamp >= ? ORDER BY timestamp DESC"
+        params = (cutoff_time,)
+        if limit:
+            query += " LIMIT ?"
+            params += (int(limit),)
 
-            query = f"SELECT * FROM {table} WHERE timestamp >= ? ORDER BY timestamp DESC"
-            if limit:
-                query += f" LIMIT {limit}"
+        cursor = self._read_conn().execute(query, params)
+        return {
+            "columns": [column[0] for column in cursor.description],
+            "rows": cursor.fetchall()
+        }
 
-            cursor.execute(query, (cutoff_time,))
-            rows = cursor.fetchall()
+    def get_history(self, table: str, hours: int = 24, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Retrieve historical data from a table.
 
-            conn.close()
+        Args:
+            table: Table name (cpu_history, memory_history, etc.)
+            hours: Number of hours to retrieve
+            limit: Maximum number of records to return
 
-            return [dict(row) for row in rows]
+        Returns:
+            List of historical records
+        """
+        return to_dicts(self.get_history_columnar(table, hours=hours, limit=limit))
 
-    def cleanup_old_data(self, retention_hours: int = 24):
+    def cleanup_old_data(self, retention_hours: int = 24, chunk_size: int = 5000) -> int:
         """
         Remove data older than retention period.
 
+        Rows are deleted in chunks of chunk_size, each in its own short
+        transaction with a brief pause in between, so the writer thread is
+        never locked out for the length of a large purge.
+
         Args:
             retention_hours: Number of hours to retain
-        """
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cutoff_time = (datetime.now() - timedelta(hours=retention_hours)).isoformat()
-
-            tables = ["cpu_history", "memory_history", "disk_history", "network_history", "gpu_history"]
+            chunk_size: Maximum rows deleted per transaction
 
-            for table in tables:
-                cursor.execute(f"DELETE FROM {table} WHERE timestamp < ?", (cutoff_time,))
-
-            conn.commit()
-            conn.close()
+        Returns:
+            Total number of rows deleted
+        """
+        cutoff_time = (datetime.now() - timedelta(hours=retention_hours)).isoformat()
+        pause = threading.Event()
+        deleted = 0
+
+        for table in HISTORY_TABLES:
+            sql = (f"DELETE FROM {table} WHERE rowid IN "
+                   f"(SELECT rowid FROM {table} WHERE timestamp < ? LIMIT ?)")
+            while True:
+                with self._transaction() as conn:
+                    count = conn.execute(sql, (cutoff_time, chunk_size)).rowcount
+                deleted += count
+                if count < chunk_size:
+                    break
+                pause.wait(0.001)
+
+        return deleted
 
     def get_statistics(self, table: str, hours: int = 1) -> Dict:
         """
@@ -329,41 +610,34 @@ class HistoricalDatabase:
         Returns:
             Dictionary with min, max, avg statistics
         """
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
-
-            # Get numeric columns for the table
-            if table == "cpu_history":
-                metric = "usage_percent"
-            elif table == "memory_history":
-                metric = "virtual_percent"
-            elif table == "disk_history":
-                metric = "percent"
-            elif table == "gpu_history":
-                metric = "utilization_gpu"
-            else:
-                return {}
-
-            cursor.execute(f"""
-                SELECT
-                    MIN({metric}) as min,
-                    MAX({metric}) as max,
-                    AVG({metric}) as avg,
-                    COUNT(*) as count
-                FROM {table}
-                WHERE timestamp >= ?
-            """, (cutoff_time,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            return {
-                "min": row[0],
-                "max": row[1],
-                "avg": row[2],
-                "count": row[3],
-                "hours": hours
-            }
\ No newline at end of file
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+
+        # Get numeric columns for the table
+        if table == "cpu_history":
+            metric = "usage_percent"
+        elif table == "memory_history":
+            metric = "virtual_percent"
+        elif table == "disk_history":
+            metric = "percent"
+        elif table == "gpu_history":
+            metric = "utilization_gpu"
+        else:
+            return {}
+
+        row = self._read_conn().execute(f"""
+            SELECT
+                MIN({metric}) as min,
+                MAX({metric}) as max,
+                AVG({metric}) as avg,
+                COUNT(*) as count
+            FROM {table}
+            WHERE timestamp >= ?
+        """, (cutoff_time,)).fetchone()
+
+        return {
+            "min": row[0],
+            "max": row[1],
+            "avg": row[2],
+            "count": row[3],
+            "hours": hours
+        }
@@ -1,10 +1,61 @@
 """Data export functionality."""
 import json
 import csv
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Serialize monitor records (dataclasses) as dicts and anything else as str."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def to_json_bytes(data, pretty: bool = True) -> bytes:
+    """
+    Serialize monitor data to UTF-8 JSON, with orjson when it is installed.
+
+    Values JSON cannot represent natively (datetimes, numpy scalars and
+    arrays, dataclass records) are handled in C by orjson; the stdlib
+    fallback turns records into dicts and anything else into str.
+
+    Args:
+        data: Data to serialize
+        pretty: If True, indent the output by two spaces
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=_json_default).encode()
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+
+def to_json(data, pretty: bool = True) -> str:
+    """
+    Serialize monitor data to a JSON string (see to_json_bytes).
+
+    Args:
+        data: Data to serialize
+        pretty: If True, indent the output by two spaces
+
+    Returns:
+        JSON text
+    """
+    return to_json_bytes(data, pretty).decode()
 
 
 class DataExporter:
@@ -20,13 +71,17 @@ class DataExporter:
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_to_json(self, data: Dict, filename: Optional[str] = None) -> str:
+    def export_to_json(self, data: Dict, filename: Optional[str] = None, pretty: bool = False) -> str:
         """
         Export data to JSON format.
 
+        Uses orjson when it is installed. Output is compact unless pretty
+        is set.
+
         Args:
             data: Data to export
             filename: Optional filename (auto-generated if not provided)
+            pretty: If True, indent the output by two spaces
 
         Returns:
             Path to exported file
@@ -37,8 +92,8 @@ class DataExporter:
 
         filepath = self.export_dir / filename
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            f.write(to_json_bytes(data, pretty))
 
         return str(filepath)
 
@@ -62,9 +117,46 @@ class DataExporter:
 
         filepath = self.export_dir / filename
 
-        # Use pandas for easier CSV export
-        df = pd.DataFrame(data)
-        df.to_csv(filepath, index=False)
+        # Columns are the union of all row keys, in first-seen order;
+        # rows missing a column get an empty cell.
+        if all(row.keys() == data[0].keys() for row in data):
+            fieldnames = list(data[0])
+        else:
+            fieldnames = list(dict.fromkeys(key for row in data for key in row))
+
+        with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+            writer.writeheader()
+            writer.writerows(data)
+
+        return str(filepath)
+
+    def export_columnar_to_csv(self, result: Dict, filename: Optional[str] = None) -> str:
+        """
+        Export a columnar result ({"columns": [...], "rows": [...]}) to CSV.
+
+        Rows are written as-is, without building a dict per record.
+
+        Args:
+            result: Columnar data, e.g. from HistoricalDatabase.get_history_columnar
+            filename: Optional filename (auto-generated if not provided)
+
+        Returns:
+            Path to exported file
+        """
+        if not result["rows"]:
+            raise ValueError("No data to export")
+
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"monitor_export_{timestamp}.csv"
+
+        filepath = self.export_dir / filename
+
+        with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(result["columns"])
+            writer.writerows(result["rows"])
 
         return str(filepath)
 
@@ -116,24 +208,36 @@ class DataExporter:
         """
         Flatten nested dictionary for CSV export.
 
+        Walks the nesting with an explicit stack of item iterators, so keys
+        come out in the same depth-first order as the nested dict without
+        recursing or merging per-level lists.
+
         Args:
             data: Nested dictionary
-            parent_key: Parent key for recursion
+            parent_key: Prefix for all flattened keys
             sep: Separator for nested keys
 
         Returns:
             Flattened dictionary
         """
-        items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-            if isinstance(v, dict):
-                items.extend(self._flatten_snapshot(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                # Convert lists to string representation
-                items.append((new_key, str(v)))
+        flat = {}
+        stack = [(parent_key, iter(data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                key = prefix + sep + str(k) if prefix else k
+
+                if is_dataclass(v):
+                    v = asdict(v)
+                if isinstance(v, dict):
+                    stack.append((key, iter(v.items())))
+                    break
+                elif isinstance(v, list):
+                    # Convert lists to string representation
+                    flat[key] = str(v)
+                else:
+                    flat[key] = v
             else:
-                items.append((new_key, v))
+                stack.pop()
 
-        return dict(items)
+        return flat
@@ -1,35 +1,43 @@
 #!/usr/bin/env python3
-"""Test script for GPU benchmark functionality."""
+"""Test script for GPU benchmark functionality.
 
+Runs standalone or under pytest, which supplies a session-wide
+GPUBenchmark from conftest.py.
+"""
+
+from script_utils import run_buffered
 from src.monitors.gpu_benchmark import GPUBenchmark
-import json
+from src.storage.exporter import to_json
+
 
-print("Testing GPU Benchmark Module...")
-print("=" * 70)
+def test_gpu_info(gpu_benchmark):
+    """Report library availability and the info for GPU 0."""
+    benchmark = gpu_benchmark
 
-benchmark = GPUBenchmark()
+    print("Testing GPU Benchmark Module...")
+    print("=" * 70)
 
-print(f"\nGPU Available: {benchmark.is_available()}")
-print(f"PyTorch Available: {benchmark.torch_available}")
-print(f"pynvml Available: {benchmark.pynvml_available}")
-print(f"GPU Count: {benchmark.gpu_count}")
+    print(f"\nGPU Available: {benchmark.is_available()}")
+    print(f"PyTorch Available: {benchmark.torch_available}")
+    print(f"pynvml Available: {benchmark.pynvml_available}")
+    print(f"GPU Count: {benchmark.gpu_count}")
 
-if not benchmark.is_available():
-    print("\nNo GPU or GPU libraries available.")
-    print("\nTo enable GPU benchmarks:")
-    print("1. Install PyTorch with CUDA:")
-    print("   pip install torch torchvision --index-url https://download.pytorch.org/whl/cu118")
-    print("2. Or install pynvml:")
-    print("   pip install pynvml")
-    exit(0)
+    if not benchmark.is_available():
+        print("\nNo GPU or GPU libraries available.")
+        print("\nTo enable GPU benchmarks:")
+        print("1. Install PyTorch with CUDA:")
+        print("   pip install torch torchvision --index-url https://download.pytorch.org/whl/cu118")
+        print("2. Or install pynvml:")
+        print("   pip install pynvml")
+        return
 
-print("\n" + "=" * 70)
-print("Getting GPU Info...")
-print("=" * 70)
+    print("\n" + "=" * 70)
+    print("Getting GPU Info...")
+    print("=" * 70)
 
-try:
     info = benchmark.get_gpu_info(0)
-    print(json.dumps(info, indent=2, default=str))
+    print(to_json(info))
+    assert info["device_id"] == 0
 
     if benchmark.torch_available:
         print("\n" + "=" * 70)
@@ -48,7 +56,6 @@ try:
         print("\nInstall PyTorch to run compute benchmarks:")
         print("  pip install torch torchvision --index-url https://download.pytorch.org/whl/cu118")
 
-except Exception as e:
-    print(f"\nError: {e}")
-    import traceback
-    traceback.print_exc()
+
+if __name__ == "__main__":
+    run_buffered(test_gpu_info, GPUBenchmark(), error_prefix="Error")
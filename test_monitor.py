@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
-"""Test the SpeedTestMonitor module."""
+"""Test the SpeedTestMonitor module.
 
+Runs standalone or under pytest, which supplies a session-wide
+SpeedTestMonitor from conftest.py.
+"""
+
+from script_utils import run_buffered
 from src.monitors.speedtest import SpeedTestMonitor
-import json
+from src.storage.exporter import to_json
 
-print("Testing SpeedTestMonitor module...")
-print("=" * 60)
 
-try:
-    monitor = SpeedTestMonitor()
+def test_speedtest_monitor(speedtest_monitor):
+    """Run a full speed test through the monitor."""
+    print("Testing SpeedTestMonitor module...")
+    print("=" * 60)
 
     print("\nRunning speedtest via monitor...")
-    result = monitor.run_speedtest()
+    result = speedtest_monitor.run_speedtest()
 
     print("\nResult:")
-    print(json.dumps(result, indent=2, default=str))
+    print(to_json(result))
 
     if 'error' in result:
         print(f"\n❌ ERROR: {result['error']}")
@@ -26,7 +31,8 @@ try:
         print(f"Upload: {result['upload']['formatted']}")
         print(f"Ping: {result['ping']['formatted']}")
 
-except Exception as e:
-    print(f"\n❌ EXCEPTION: {e}")
-    import traceback
-    traceback.print_exc()
+    assert 'error' not in result, result.get('details')
+
+
+if __name__ == "__main__":
+    run_buffered(test_speedtest_monitor, SpeedTestMonitor(), error_prefix="❌ EXCEPTION")
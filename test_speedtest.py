@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
-"""Test script to debug speedtest functionality."""
+"""Test script to debug speedtest functionality.
 
-import speedtest
+Runs standalone or under pytest, which supplies a session-wide
+speedtest client from conftest.py.
+"""
 
-print("Testing speedtest library...")
-print("=" * 60)
+from script_utils import run_buffered
 
-try:
-    st = speedtest.Speedtest()
+
+def test_speedtest_library(speedtest_client):
+    """Run best-server selection, download and upload with speedtest-cli directly."""
+    st = speedtest_client
+
+    print("Testing speedtest library...")
+    print("=" * 60)
 
     print("\n1. Getting best server...")
     best = st.get_best_server()
@@ -27,7 +33,9 @@ try:
     print("SUCCESS! Speedtest library works correctly.")
     print("=" * 60)
 
-except Exception as e:
-    print(f"\nERROR: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Imported here so pytest collection can skip without speedtest-cli
+    import speedtest
+
+    run_buffered(test_speedtest_library, speedtest.Speedtest(), error_prefix="ERROR")